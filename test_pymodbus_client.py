@@ -1,15 +1,44 @@
+import time
+
 from pymodbus.client import ModbusTcpClient
 
-client = ModbusTcpClient(host="127.0.0.1", port=5020)
+HOST = "127.0.0.1"
+PORT = 5020
+REG_COUNT = 64      # whole holding bank in one request
+POLL_S = 0.5
+POLLS = 10
+
+
+def _connect() -> ModbusTcpClient:
+    # One client for the whole session; short timeout so a dead server fails fast
+    client = ModbusTcpClient(host=HOST, port=PORT, timeout=0.5)
+    client.connect()
+    return client
+
+
+if __name__ == "__main__":
+    client = _connect()
+    try:
+        for _ in range(POLLS):
+            if not client.connected and not client.connect():
+                print("Could not connect to Modbus server.")
+                time.sleep(POLL_S)
+                continue
 
-if client.connect():
-    result = client.read_holding_registers(address=0, count=20)
+            try:
+                result = client.read_holding_registers(address=0, count=REG_COUNT)
+            except Exception as e:
+                # Drop and reconnect rather than trying to recover the socket
+                print("Modbus read failed, reconnecting:", e)
+                client.close()
+                client = _connect()
+                continue
 
-    if not result.isError():
-        print("Registers:", result.registers)
-    else:
-        print("Modbus read error:", result)
+            if not result.isError():
+                print("Registers:", result.registers)
+            else:
+                print("Modbus read error:", result)
 
-    client.close()
-else:
-    print("Could not connect to Modbus server.")
+            time.sleep(POLL_S)
+    finally:
+        client.close()
@@ -6,47 +6,78 @@ from __future__ import annotations
 
 import os
 import sys
+import copy
 import time
-import json
+import asyncio
+import queue
 import signal
 import logging
+import logging.handlers
+import threading
 import traceback
 from dataclasses import dataclass
 from typing import Optional, Any, Dict
 
+# Child of the "viscologic" logger, so it goes through _setup_logging's handlers
+_log = logging.getLogger("viscologic.app")
+
 # -----------------------------
 # Helpers
 # -----------------------------
 
+_ENSURED_DIRS: set[str] = set()
+
 def _ensure_dir(path: str) -> None:
-    os.makedirs(path, exist_ok=True)
+    # makedirs once per absolute path; local so startup needs no other viscologic module
+    p = os.path.abspath(path)
+    if p in _ENSURED_DIRS:
+        return
+    os.makedirs(p, exist_ok=True)
+    _ENSURED_DIRS.add(p)
 
 def _now_ms() -> int:
-    return int(time.time() * 1000)
+    # Wall-clock epoch ms (frames carry it like the real EventBus); integer-only
+    return time.time_ns() // 1_000_000
+
+_IMPORT_CACHE: Dict[tuple[str, str | None], Any] = {}
 
 def _safe_import(module_path: str, attr: str | None = None):
     """
     Safe import so app can run even before all files are pasted.
     Once you paste the real modules, imports will automatically use them.
+    Results (including misses -> None) are cached per (module, attr).
     """
+    key = (module_path, attr)
+    if key in _IMPORT_CACHE:
+        return _IMPORT_CACHE[key]
     try:
         mod = __import__(module_path, fromlist=[attr] if attr else [])
-        return getattr(mod, attr) if attr else mod
-    except Exception:
-        # --- DEBUG: Print the error so we can see it ---
-        print(f"\n[DEBUG] !!! Failed to import {module_path} !!!")
-        import traceback
-        traceback.print_exc()
-        print("-" * 60 + "\n")
-        # -----------------------------------------------
-        return None
+        result = getattr(mod, attr) if attr else mod
+    except Exception as e:
+        # Traceback only on request; a known-missing optional module is normal
+        if os.environ.get("VISC_DEBUG_IMPORT", "0") == "1":
+            _log.warning("Failed to import %s", module_path, exc_info=True)
+        else:
+            _log.warning("Failed to import %s: %s (set VISC_DEBUG_IMPORT=1 for traceback)", module_path, e)
+            _log.debug("Import traceback for %s", module_path, exc_info=True)
+        result = None
+    _IMPORT_CACHE[key] = result
+    return result
+
+_LOG_LISTENER: Optional[logging.handlers.QueueListener] = None
 
 def _setup_logging(log_dir: str, level: str = "INFO") -> logging.Logger:
+    """
+    Console + rotating file handlers run on a QueueListener thread, so the
+    orchestrator/UI threads only enqueue records and never block on disk I/O.
+    """
+    global _LOG_LISTENER
     _ensure_dir(log_dir)
 
     logger = logging.getLogger("viscologic")
     logger.setLevel(getattr(logging, level.upper(), logging.INFO))
     logger.handlers.clear()
+    _stop_logging()
 
     fmt = logging.Formatter(
         fmt="%(asctime)s | %(levelname)s | %(name)s | %(message)s",
@@ -56,17 +87,35 @@ def _setup_logging(log_dir: str, level: str = "INFO") -> logging.Logger:
     # Console
     ch = logging.StreamHandler(sys.stdout)
     ch.setFormatter(fmt)
-    logger.addHandler(ch)
 
-    # File
+    # File (10 MB x 5); opened lazily by the listener thread on first record
     fh_path = os.path.join(log_dir, "viscologic.log")
-    fh = logging.FileHandler(fh_path, encoding="utf-8")
+    fh = logging.handlers.RotatingFileHandler(
+        fh_path, maxBytes=10 * 1024 * 1024, backupCount=5, encoding="utf-8", delay=True
+    )
     fh.setFormatter(fmt)
-    logger.addHandler(fh)
+
+    q: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    logger.addHandler(logging.handlers.QueueHandler(q))
+    _LOG_LISTENER = logging.handlers.QueueListener(q, ch, fh, respect_handler_level=True)
+    _LOG_LISTENER.start()
 
     logger.info("Logging initialized. log_file=%s", fh_path)
     return logger
 
+def _stop_logging() -> None:
+    """Flush queued records and stop the listener thread (idempotent)."""
+    global _LOG_LISTENER
+    listener, _LOG_LISTENER = _LOG_LISTENER, None
+    if listener is None:
+        return
+    listener.stop()
+    for h in listener.handlers:
+        try:
+            h.close()
+        except Exception:
+            pass
+
 # -----------------------------
 # Default Config (fallback)
 # -----------------------------
@@ -124,7 +173,9 @@ DEFAULT_CONFIG: Dict[str, Any] = {
 
 class _FallbackEventBus:
     def __init__(self):
-        self.latest_frame = {
+        # (seq, frame): replaced with one attribute store, so readers always
+        # get a matching pair without taking a lock
+        self._frame_ref: tuple[int, Dict[str, Any]] = (0, {
             "timestamp_ms": _now_ms(),
             "viscosity_cp": 0.0,
             "temp_c": 25.0,
@@ -132,11 +183,34 @@ class _FallbackEventBus:
             "health_pct": 0,
             "status_word": 0,
             "alarm_word": 0,
-        }
+        })
         self._stop = False
+        self._new_frame = threading.Event()
+        self._new_frame.set()  # draw the initial frame
+
+    @property
+    def latest_frame(self) -> Dict[str, Any]:
+        return self._frame_ref[1]
 
     def publish_frame(self, frame: Dict[str, Any]) -> None:
-        self.latest_frame = frame
+        # Kept by reference, same contract as EventBus.publish_frame: readers
+        # treat it as read-only. _FallbackOrchestrator republishes its one
+        # dict and only ever replaces timestamp_ms, a single atomic store.
+        self._frame_ref = (self._frame_ref[0] + 1, frame)
+        self._new_frame.set()
+
+    def get_latest_frame(self) -> Dict[str, Any]:
+        return self._frame_ref[1]
+
+    def get_latest_frame_seq(self) -> tuple[int, Dict[str, Any]]:
+        return self._frame_ref
+
+    def wait_new_frame(self, timeout: float) -> bool:
+        """True once a frame was published since the last call (or timeout)."""
+        if not self._new_frame.wait(timeout):
+            return False
+        self._new_frame.clear()
+        return True
 
     def stop(self) -> None:
         self._stop = True
@@ -147,6 +221,16 @@ class _FallbackOrchestrator:
         self.bus = bus
         self.logger = logger
         self._running = False
+        # Reused every tick; only timestamp_ms changes for dummy data
+        self._frame: Dict[str, Any] = {
+            "timestamp_ms": 0,
+            "viscosity_cp": 0.0,
+            "temp_c": 25.0,
+            "freq_hz": 180.0,
+            "health_pct": 10,
+            "status_word": 0,
+            "alarm_word": 0,
+        }
 
     def start(self) -> None:
         self._running = True
@@ -160,17 +244,8 @@ class _FallbackOrchestrator:
         # Generates dummy data so UI/PLC can show something.
         if not self._running:
             return
-        t = _now_ms()
-        frame = {
-            "timestamp_ms": t,
-            "viscosity_cp": 0.0,
-            "temp_c": 25.0,
-            "freq_hz": 180.0,
-            "health_pct": 10,
-            "status_word": 0,
-            "alarm_word": 0,
-        }
-        self.bus.publish_frame(frame)
+        self._frame["timestamp_ms"] = _now_ms()
+        self.bus.publish_frame(self._frame)
 
 class _FallbackModbusServer:
     def __init__(self, config: Dict[str, Any], bus: Any, logger: logging.Logger):
@@ -188,7 +263,19 @@ class _FallbackModbusServer:
         self._running = False
         self.logger.info("Modbus server stopped (fallback).")
 
+class _FrameDefault(dict):
+    """Frame view for str.format_map: missing keys render as 0."""
+    def __missing__(self, key: str) -> int:
+        return 0
+
 class _FallbackUI:
+    _LINE_TMPL = (
+        "\rVisc={viscosity_cp:8.2f} cP | "
+        "T={temp_c:6.2f} C | "
+        "F={freq_hz:7.2f} Hz | "
+        "Health={health_pct:3d}%"
+    )
+
     def __init__(self, config: Dict[str, Any], bus: Any, logger: logging.Logger):
         self.config = config
         self.bus = bus
@@ -198,17 +285,29 @@ class _FallbackUI:
         # Console UI fallback (PyQt will come later)
         global _SHUTDOWN
         self.logger.info("UI started (fallback console mode). Press Ctrl+C to exit.")
+        wait_new_frame = getattr(self.bus, "wait_new_frame", None)
+        latest_seq = getattr(self.bus, "get_latest_frame_seq", None)
+        last_seq = -1
         try:
             while not _SHUTDOWN:
-                f = getattr(self.bus, "latest_frame", {})
-                sys.stdout.write(
-                    f"\rVisc={f.get('viscosity_cp',0):8.2f} cP | "
-                    f"T={f.get('temp_c',0):6.2f} C | "
-                    f"F={f.get('freq_hz',0):7.2f} Hz | "
-                    f"Health={f.get('health_pct',0):3d}%"
-                )
+                if wait_new_frame is not None:
+                    # Redraw only when a frame arrives; the bounded wait is
+                    # what notices _SHUTDOWN when no frames come
+                    if not wait_new_frame(_SHUTDOWN_POLL_S):
+                        continue
+                else:
+                    time.sleep(0.5)
+                if latest_seq is not None:
+                    seq, f = latest_seq()
+                    if seq == last_seq:
+                        continue
+                    last_seq = seq
+                else:
+                    f = self.bus.get_latest_frame()
+                # Through sys.stdout (not the raw fd) so it stays ordered with
+                # the console log handler and follows any redirection
+                sys.stdout.write(self._LINE_TMPL.format_map(_FrameDefault(f)))
                 sys.stdout.flush()
-                time.sleep(0.5)
             return 0
         except KeyboardInterrupt:
             return 0
@@ -247,7 +346,7 @@ def load_config(logger: logging.Logger) -> Dict[str, Any]:
             logger.error("ConfigManager failed, using DEFAULT_CONFIG. err=%s", e)
 
     # fallback
-    cfg = json.loads(json.dumps(DEFAULT_CONFIG))
+    cfg = copy.deepcopy(DEFAULT_CONFIG)
     logger.warning("Using DEFAULT_CONFIG (fallback). Paste core/config_manager.py to enable YAML/schema.")
     return cfg
 
@@ -324,8 +423,12 @@ def build_context() -> AppContext:
 # -----------------------------
 
 _SHUTDOWN = False
+# Longest a wait goes without re-checking _SHUTDOWN (where no wakeup exists)
+_SHUTDOWN_POLL_S = 0.25
 
 def _handle_signal(sig, frame):
+    # Only a flag store: the handler can interrupt the main thread anywhere,
+    # including inside a lock that waking a waiter would need
     global _SHUTDOWN
     _SHUTDOWN = True
 
@@ -352,6 +455,66 @@ def safe_shutdown(ctx: AppContext) -> None:
         ctx.logger.error("Error stopping bus:\n%s", traceback.format_exc())
 
     ctx.logger.info("Shutdown complete.")
+    _stop_logging()
+
+# -----------------------------
+# Headless (asyncio)
+# -----------------------------
+
+async def _tick_loop(orchestrator: Any, tick_ms: int, stop: asyncio.Event) -> None:
+    # Orchestrator tick for fallback; real orchestrator runs its own thread
+    period_s = max(0.01, tick_ms / 1000.0)
+    while not stop.is_set():
+        orchestrator.tick()
+        await asyncio.sleep(period_s)
+
+async def _run_headless(ctx: AppContext, tick_ms: int) -> None:
+    """
+    Waits on an asyncio.Event until SIGINT/SIGTERM; periodic work runs as tasks.
+    Where the loop can own the signals (Unix) they set the Event directly;
+    otherwise _handle_signal's flag is polled every _SHUTDOWN_POLL_S.
+    """
+    loop = asyncio.get_running_loop()
+    stop = asyncio.Event()
+
+    def _request_stop() -> None:
+        # Runs as a loop callback, not in signal context
+        global _SHUTDOWN
+        _SHUTDOWN = True
+        stop.set()
+
+    loop_signals = []
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, _request_stop)
+            loop_signals.append(sig)
+        except (NotImplementedError, RuntimeError, ValueError):
+            pass  # e.g. Windows; fall back to polling the flag
+
+    if _SHUTDOWN:
+        stop.set()  # signalled before the loop took the handlers over
+
+    tasks = []
+    if hasattr(ctx.orchestrator, "tick"):
+        tasks.append(asyncio.create_task(_tick_loop(ctx.orchestrator, tick_ms, stop)))
+
+    try:
+        if loop_signals:
+            await stop.wait()
+        else:
+            while not _SHUTDOWN:
+                try:
+                    await asyncio.wait_for(stop.wait(), timeout=_SHUTDOWN_POLL_S)
+                except asyncio.TimeoutError:
+                    pass
+            stop.set()
+    finally:
+        for sig in loop_signals:
+            loop.remove_signal_handler(sig)
+            signal.signal(sig, _handle_signal)
+        for t in tasks:
+            t.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
 
 # -----------------------------
 # Main
@@ -382,11 +545,7 @@ def main() -> int:
         # No UI: run headless loop
         tick_ms = int(ctx.config.get("app", {}).get("tick_ms", 100))
         log.info("Running headless loop. tick_ms=%d", tick_ms)
-        while not _SHUTDOWN:
-            # Orchestrator tick for fallback; real orchestrator may be threaded
-            if hasattr(ctx.orchestrator, "tick"):
-                ctx.orchestrator.tick()
-            time.sleep(max(0.01, tick_ms / 1000.0))
+        asyncio.run(_run_headless(ctx, tick_ms))
 
         return 0
 
@@ -5,9 +5,10 @@
 from __future__ import annotations
 
 import os
+import copy
 import json
 import logging
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
 # -----------------------------
 # Default Config (kept in sync with app.py fallback)
@@ -60,17 +61,50 @@ DEFAULT_CONFIG: Dict[str, Any] = {
 }
 
 
+# Config file locations relative to base_dir
+_CONFIG_DIR_REL = ("viscologic", "config")
+_SETTINGS_NAME = "settings.yaml"
+_SCHEMA_NAME = "schema.json"
+
+
 def _deep_merge(base: Dict[str, Any], override: Dict[str, Any]) -> Dict[str, Any]:
-    """Recursively merges override into base (override wins)."""
-    out = dict(base)
+    """Recursively merges override into base in place (override wins). Returns base."""
     for k, v in override.items():
-        if isinstance(v, dict) and isinstance(out.get(k), dict):
-            out[k] = _deep_merge(out[k], v)
+        if isinstance(v, dict) and isinstance(base.get(k), dict):
+            _deep_merge(base[k], v)
         else:
-            out[k] = v
+            base[k] = v
+    return base
+
+
+def _flatten(cfg: Dict[str, Any], prefix: str = "", out: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Flattens nested dicts into {"app.tick_ms": 100, ...} (leaf values only)."""
+    if out is None:
+        out = {}
+    for k, v in cfg.items():
+        path = f"{prefix}{k}"
+        if isinstance(v, dict):
+            _flatten(v, path + ".", out)
+        else:
+            out[path] = v
     return out
 
 
+_MISSING = object()
+
+
+_ENSURED_DIRS: set[str] = set()
+
+
+def _ensure_dir(path: str) -> None:
+    """os.makedirs once per absolute path (save() may run on every UI change)."""
+    p = os.path.abspath(path)
+    if p in _ENSURED_DIRS:
+        return
+    os.makedirs(p, exist_ok=True)
+    _ENSURED_DIRS.add(p)
+
+
 def _read_text(path: str) -> str:
     with open(path, "r", encoding="utf-8") as f:
         return f.read()
@@ -78,12 +112,13 @@ def _read_text(path: str) -> str:
 
 def _load_yaml(path: str) -> Dict[str, Any]:
     """
-    Loads YAML using PyYAML if available.
+    Loads YAML using PyYAML if available (libyaml C loader when compiled in).
     If not installed, raises ImportError so caller can handle.
     """
     import yaml  # type: ignore
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
     txt = _read_text(path)
-    data = yaml.safe_load(txt) or {}
+    data = yaml.load(txt, Loader=loader) or {}
     if not isinstance(data, dict):
         raise ValueError("settings.yaml must be a mapping (dict) at root.")
     return data
@@ -109,23 +144,33 @@ class ConfigManager:
         self.base_dir = base_dir or os.getcwd()
         self.logger = logger or logging.getLogger("viscologic.config")
 
-        self.config_dir = os.path.join(self.base_dir, "viscologic", "config")
-        self.default_settings_path = os.path.join(self.config_dir, "settings.yaml")
-        #print(self.default_settings_path)
-        self.default_schema_path = os.path.join(self.config_dir, "schema.json")
-        #print(self.default_schema_path)
+        # Joined once per instance; an env override (even empty) wins
+        self.config_dir = os.path.join(self.base_dir, *_CONFIG_DIR_REL)
+        self.default_settings_path = os.path.join(self.config_dir, _SETTINGS_NAME)
+        self.default_schema_path = os.path.join(self.config_dir, _SCHEMA_NAME)
         self.settings_path = os.environ.get("VISC_CONFIG_PATH", self.default_settings_path)
         self.schema_path = os.environ.get("VISC_SCHEMA_PATH", self.default_schema_path)
         
         # Store the loaded config dict for get/set operations
         self._config_dict: Optional[Dict[str, Any]] = None
+        # Flat dot-path -> leaf value view of _config_dict. Only kept for a
+        # config this manager owns (load()); None for an attach()ed dict,
+        # which the caller may mutate directly.
+        self._flat: Optional[Dict[str, Any]] = None
+        self._loaded: bool = False
+        # "app.mode" -> ("app", "mode"), split once per distinct key
+        self._key_cache: Dict[str, Tuple[str, ...]] = {}
+        # jsonschema validator, built on first _validate()
+        self._validator: Any = None
 
     def load(self) -> Dict[str, Any]:
         """
         Returns merged config dict (DEFAULT_CONFIG + yaml overrides).
         Validation is best-effort (jsonschema if installed, otherwise basic guards).
+        The dict is the one get() reads (leaves via a cache), so callers must
+        change it only through set(), as with attach().
         """
-        cfg = dict(DEFAULT_CONFIG)
+        cfg = copy.deepcopy(DEFAULT_CONFIG)
 
         # 1) Load YAML if exists
         if os.path.exists(self.settings_path):
@@ -148,19 +193,42 @@ class ConfigManager:
 
         # Store for get/set operations
         self._config_dict = cfg
+        self._flat = _flatten(cfg)
+        self._loaded = True
         return cfg
+
+    def attach(self, cfg: Dict[str, Any]) -> None:
+        """
+        Use an already-loaded config dict (e.g. the one app.py passes around)
+        instead of reading settings.yaml again. The dict stays shared with
+        the caller (set() writes into it), so get() reads it live, uncached.
+        """
+        self._config_dict = cfg
+        self._flat = None
+        self._loaded = True
+
+    def _split_key(self, key: str) -> Tuple[str, ...]:
+        keys = self._key_cache.get(key)
+        if keys is None:
+            keys = self._key_cache.setdefault(key, tuple(key.split(".")))
+        return keys
     
     def get(self, key: str, default: Any = None) -> Any:
         """
         Get a config value using dot-notation key (e.g., "app.mode").
-        Returns default if key not found.
+        Returns default if key not found. Section keys (e.g. "app") return
+        the live section dict; treat it as read-only and use set() to change it.
         """
-        if self._config_dict is None:
-            self._config_dict = self.load()
-        
-        keys = key.split(".")
+        if not self._loaded:
+            self.load()
+        flat = self._flat
+        if flat is not None:
+            value = flat.get(key, _MISSING)
+            if value is not _MISSING:
+                return value
+
         value = self._config_dict
-        for k in keys:
+        for k in self._split_key(key):
             if isinstance(value, dict) and k in value:
                 value = value[k]
             else:
@@ -172,16 +240,32 @@ class ConfigManager:
         Set a config value using dot-notation key (e.g., "app.mode").
         Creates nested dicts as needed.
         """
-        if self._config_dict is None:
-            self._config_dict = self.load()
-        
-        keys = key.split(".")
+        if not self._loaded:
+            self.load()
+
+        keys = self._split_key(key)
         target = self._config_dict
         for k in keys[:-1]:
             if k not in target:
                 target[k] = {}
             target = target[k]
+        if isinstance(value, dict):
+            value = copy.deepcopy(value)
+        old = target.get(keys[-1], _MISSING)
         target[keys[-1]] = value
+
+        # Patch only the leaves under key in the flat view
+        flat = self._flat
+        if flat is not None:
+            if isinstance(old, dict):
+                for path in _flatten(old, key + "."):
+                    flat.pop(path, None)
+            else:
+                flat.pop(key, None)
+            if isinstance(value, dict):
+                _flatten(value, key + ".", flat)
+            else:
+                flat[key] = value
     
     def save(self) -> bool:
         """
@@ -200,7 +284,7 @@ class ConfigManager:
         
         try:
             # Ensure directory exists
-            os.makedirs(os.path.dirname(self.settings_path), exist_ok=True)
+            _ensure_dir(os.path.dirname(self.settings_path))
             
             # Write YAML file
             with open(self.settings_path, "w", encoding="utf-8") as f:
@@ -233,19 +317,30 @@ class ConfigManager:
         self._basic_validate(cfg)
 
         if os.path.exists(self.schema_path):
-            try:
-                schema = _load_json(self.schema_path)
-            except Exception as e:
-                self.logger.warning("schema.json read failed (%s). Skipping schema validation.", e)
-                return
+            # Compile the validator once per instance; reloads only walk cfg
+            if self._validator is None:
+                try:
+                    schema = _load_json(self.schema_path)
+                except Exception as e:
+                    self.logger.warning("schema.json read failed (%s). Skipping schema validation.", e)
+                    return
+
+                try:
+                    import jsonschema  # type: ignore
+                    cls = jsonschema.validators.validator_for(schema)
+                    cls.check_schema(schema)
+                    self._validator = cls(schema)
+                except ImportError:
+                    self.logger.warning("jsonschema not installed. Skipping schema validation. Install: pip install jsonschema")
+                    return
+                except Exception as e:
+                    self.logger.error("schema.json is not a valid schema: %s", e)
+                    return
 
             try:
-                import jsonschema  # type: ignore
-                jsonschema.validate(instance=cfg, schema=schema)
+                self._validator.validate(cfg)
                 self.logger.info("Config validated via jsonschema: %s", self.schema_path)
                 return
-            except ImportError:
-                self.logger.warning("jsonschema not installed. Skipping schema validation. Install: pip install jsonschema")
             except Exception as e:
                 # Do not crash; log and fallback to basic checks
                 self.logger.error("Schema validation failed: %s", e)
@@ -288,38 +383,42 @@ class ConfigManager:
         """
         Absolute guards to never allow unsafe values.
         """
+        safety = cfg.setdefault("safety", {})
+        sweep = cfg.setdefault("sweep", {})
+        modbus_cfg = cfg.setdefault("modbus", {})
+
         # Safety: max current cap
-        max_ma = int(cfg.get("safety", {}).get("max_current_ma", 150))
+        max_ma = int(safety.get("max_current_ma", 150))
         if max_ma > 150:
             self.logger.warning("max_current_ma=%d exceeds 150. Forcing to 150.", max_ma)
-            cfg["safety"]["max_current_ma"] = 150
+            safety["max_current_ma"] = 150
         if max_ma < 1:
             self.logger.warning("max_current_ma=%d invalid. Forcing to 150.", max_ma)
-            cfg["safety"]["max_current_ma"] = 150
+            safety["max_current_ma"] = 150
 
         # Air calibration caps (keep conservative)
-        air_ma = int(cfg.get("safety", {}).get("air_cal_current_ma", 50))
+        air_ma = int(safety.get("air_cal_current_ma", 50))
         if air_ma > 80:
             self.logger.warning("air_cal_current_ma=%d too high. Forcing to 60.", air_ma)
-            cfg["safety"]["air_cal_current_ma"] = 60
+            safety["air_cal_current_ma"] = 60
         if air_ma < 5:
-            cfg["safety"]["air_cal_current_ma"] = 30
+            safety["air_cal_current_ma"] = 30
 
-        air_sec = int(cfg.get("safety", {}).get("air_cal_max_sec", 15))
+        air_sec = int(safety.get("air_cal_max_sec", 15))
         if air_sec > 30:
             self.logger.warning("air_cal_max_sec=%d too high. Forcing to 20.", air_sec)
-            cfg["safety"]["air_cal_max_sec"] = 20
+            safety["air_cal_max_sec"] = 20
 
         # Sweep sanity
-        fmin = float(cfg.get("sweep", {}).get("f_min", 150.0))
-        fmax = float(cfg.get("sweep", {}).get("f_max", 200.0))
+        fmin = float(sweep.get("f_min", 150.0))
+        fmax = float(sweep.get("f_max", 200.0))
         if fmin >= fmax:
             self.logger.warning("sweep f_min>=f_max; forcing to 150..200")
-            cfg["sweep"]["f_min"] = 150.0
-            cfg["sweep"]["f_max"] = 200.0
+            sweep["f_min"] = 150.0
+            sweep["f_max"] = 200.0
 
         # Modbus port sanity
-        port = int(cfg.get("modbus", {}).get("port", 5020))
+        port = int(modbus_cfg.get("port", 5020))
         if port < 1 or port > 65535:
             self.logger.warning("Invalid modbus port=%d; forcing 5020", port)
-            cfg["modbus"]["port"] = 5020
+            modbus_cfg["port"] = 5020
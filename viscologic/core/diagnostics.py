@@ -6,15 +6,41 @@ from __future__ import annotations
 import os
 import time
 import logging
-from dataclasses import dataclass, field
-from typing import Dict, Any, Optional
+import functools
+import threading
+from dataclasses import dataclass, field, replace
+from typing import Callable, Dict, Any, List, Optional, Tuple
+
+
+_now_ns = time.time_ns
 
 
 def now_ms() -> int:
-    return int(time.time() * 1000)
+    return _now_ns() // 1_000_000
+
+
+@functools.lru_cache(maxsize=1)
+def _get_adc_cls() -> Any:
+    """ADS1115Driver class, or the import exception (resolved once)."""
+    try:
+        # Local import to avoid hard dependency during unit tests
+        from viscologic.drivers.adc_ads1115 import ADS1115Driver  # type: ignore
+        return ADS1115Driver
+    except Exception as e:
+        return e
+
+
+@functools.lru_cache(maxsize=1)
+def _get_temp_cls() -> Any:
+    """MAX31865Driver class, or the import exception (resolved once)."""
+    try:
+        from viscologic.drivers.temp_max31865 import MAX31865Driver  # type: ignore
+        return MAX31865Driver
+    except Exception as e:
+        return e
 
 
-@dataclass
+@dataclass(slots=True)
 class CheckItem:
     name: str
     ok: bool
@@ -22,7 +48,7 @@ class CheckItem:
     ts_ms: int = field(default_factory=now_ms)
 
 
-@dataclass
+@dataclass(slots=True)
 class DiagnosticsReport:
     overall_ok: bool
     items: Dict[str, CheckItem]
@@ -39,89 +65,194 @@ class DiagnosticsReport:
         }
 
 
+@dataclass(slots=True)
+class DiagSample:
+    """
+    Per-tick measurement handed to Diagnostics.update().
+    The orchestrator keeps one instance and overwrites it every tick.
+    """
+    ts: float = 0.0
+    state: str = ""
+    mode: str = ""
+    freq_hz: float = 0.0
+    duty: float = 0.0
+    adc_raw: float = 0.0
+    magnitude: float = 0.0
+    phase_deg: float = 0.0
+    viscosity_cp: float = 0.0
+    temp_c: float = 0.0
+    confidence: float = 0.0
+    locked: bool = False
+    fault: bool = False
+
+
 class Diagnostics:
     """
     Designed to be "soft" and not crash the app.
     Orchestrator will call:
       - run_startup_checks()
       - run_runtime_checks(frame)
+      - update(sample) every tick
     """
 
     def __init__(self, config: Dict[str, Any], logger: Optional[logging.Logger] = None):
         self.config = config or {}
         self.logger = logger or logging.getLogger("viscologic.diagnostics")
 
+        # Soft driver probes import + touch hardware; keep their result for a
+        # while so repeated invocations don't re-probe.
+        diag_cfg = (self.config.get("diagnostics", {}) or {})
+        self._probe_ttl_s = float(diag_cfg.get("probe_cache_s", 60.0))
+        self._probe_cache: Dict[str, Tuple[float, CheckItem]] = {}
+        self._probe_lock = threading.Lock()
+
+        # Runtime checks run per frame; resolve their config once here
+        self._max_temp_c = float((self.config.get("safety", {}) or {}).get("max_temp_c", 85.0))
+        self._last_runtime_key: Optional[Tuple[Any, ...]] = None
+        self._last_runtime_rep: Optional[DiagnosticsReport] = None
+
+        # Latest tick sample (reference only; owned by the tick thread)
+        self._last_sample: Optional[DiagSample] = None
+        self._sample_count = 0
+
     # -----------------------
     # Startup checks
     # -----------------------
 
-    def run_startup_checks(self) -> DiagnosticsReport:
-        items: Dict[str, CheckItem] = {}
-
-        # Storage writable
-        items["storage_writable"] = self._check_storage_writable()
-
-        # ADC probe (soft)
-        items["adc_present"] = self._check_adc_present_soft()
+    def run_startup_checks(self, use_probe_cache: bool = False) -> DiagnosticsReport:
+        """
+        An explicit self-check always re-probes the hardware (e.g. after a
+        sensor was reseated) and refreshes the probe cache; pass
+        use_probe_cache=True for repeated polling within probe_cache_s.
+        """
+        results: List[Tuple[str, CheckItem]] = [
+            # Storage writable
+            ("storage_writable", self._check_storage_writable()),
+            # ADC probe (soft)
+            ("adc_present", self._cached_probe(
+                "adc_present", self._check_adc_present_soft, use_probe_cache
+            )),
+            # Temp sensor probe (soft)
+            ("temp_present", self._cached_probe(
+                "temp_present", self._check_temp_present_soft, use_probe_cache
+            )),
+            # Modbus config check
+            ("modbus_config", self._check_modbus_config()),
+        ]
+        overall_ok = True
+        for _, it in results:
+            if not it.ok:
+                overall_ok = False
+
+        rep = DiagnosticsReport(overall_ok=overall_ok, items=dict(results))
+
+        log_info = self.logger.info
+        log_info("Startup diagnostics: overall_ok=%s", overall_ok)
+        for k, it in results:
+            log_info("  - %s: ok=%s %s", k, it.ok, it.details)
 
-        # Temp sensor probe (soft)
-        items["temp_present"] = self._check_temp_present_soft()
+        return rep
 
-        # Modbus config check
-        items["modbus_config"] = self._check_modbus_config()
+    # -----------------------
+    # Per-tick sample
+    # -----------------------
 
-        overall_ok = all(i.ok for i in items.values())
-        rep = DiagnosticsReport(overall_ok=overall_ok, items=items)
+    def update(self, sample: DiagSample) -> None:
+        # Called from the tick loop: keep it to a reference store
+        self._last_sample = sample
+        self._sample_count += 1
 
-        self.logger.info("Startup diagnostics: overall_ok=%s", overall_ok)
-        for k, it in items.items():
-            self.logger.info("  - %s: ok=%s %s", k, it.ok, it.details)
+    def last_sample(self) -> Optional[DiagSample]:
+        return self._last_sample
 
-        return rep
+    @property
+    def sample_count(self) -> int:
+        return self._sample_count
 
     # -----------------------
     # Runtime checks (lightweight)
     # -----------------------
 
     def run_runtime_checks(self, frame: Dict[str, Any]) -> DiagnosticsReport:
-        items: Dict[str, CheckItem] = {}
-
         # Signal clip info if present
         clip = bool(frame.get("signal_clip", False))
-        items["signal_clip"] = CheckItem(
-            name="signal_clip",
-            ok=not clip,
-            details="OK" if not clip else "Pickup signal clipping detected",
-        )
 
         # Temperature range check (if temp is available)
         temp_c = frame.get("temp_c", None)
-        max_temp = float((self.config.get("safety", {}) or {}).get("max_temp_c", 85.0))
+        max_temp = self._max_temp_c
+        t: Optional[float] = None
         if temp_c is None:
-            items["temp_range"] = CheckItem(name="temp_range", ok=True, details="Temp not available")
+            temp_key: Any = None
         else:
             try:
                 t = float(temp_c)
-                ok = t <= max_temp
-                items["temp_range"] = CheckItem(
-                    name="temp_range",
-                    ok=ok,
-                    details=f"{t:.2f}C <= {max_temp:.2f}C" if ok else f"Overtemp {t:.2f}C > {max_temp:.2f}C",
-                )
+                # Details are shown to 0.01C, so that is the change that matters
+                temp_key = (int(round(t * 100)), t <= max_temp)
             except Exception:
-                items["temp_range"] = CheckItem(name="temp_range", ok=False, details="Temp parse error")
+                temp_key = "parse_error"
+
+        # Steady state: same inputs as last frame, reuse the check items.
+        # Reports already handed out are never modified; a new timestamp
+        # gets a new (shallow) report.
+        key = (clip, temp_key)
+        rep = self._last_runtime_rep
+        if rep is not None and key == self._last_runtime_key:
+            ts = now_ms()
+            if ts != rep.ts_ms:
+                rep = replace(rep, ts_ms=ts)
+                self._last_runtime_rep = rep
+            return rep
+
+        items: Dict[str, CheckItem] = {}
+        items["signal_clip"] = CheckItem(
+            name="signal_clip",
+            ok=not clip,
+            details="OK" if not clip else "Pickup signal clipping detected",
+        )
+
+        if temp_key is None:
+            items["temp_range"] = CheckItem(name="temp_range", ok=True, details="Temp not available")
+        elif t is None:
+            items["temp_range"] = CheckItem(name="temp_range", ok=False, details="Temp parse error")
+        else:
+            ok = t <= max_temp
+            items["temp_range"] = CheckItem(
+                name="temp_range",
+                ok=ok,
+                details=f"{t:.2f}C <= {max_temp:.2f}C" if ok else f"Overtemp {t:.2f}C > {max_temp:.2f}C",
+            )
 
         overall_ok = all(i.ok for i in items.values())
-        return DiagnosticsReport(overall_ok=overall_ok, items=items)
+        rep = DiagnosticsReport(overall_ok=overall_ok, items=items)
+        self._last_runtime_key = key
+        self._last_runtime_rep = rep
+        return rep
 
     # -----------------------
     # Individual checks
     # -----------------------
 
+    def _cached_probe(self, key: str, fn: Callable[[], CheckItem], use_cache: bool = True) -> CheckItem:
+        now = time.monotonic()
+        if use_cache:
+            with self._probe_lock:
+                hit = self._probe_cache.get(key)
+            if hit is not None and (now - hit[0]) < self._probe_ttl_s:
+                return hit[1]
+        item = fn()
+        with self._probe_lock:
+            self._probe_cache[key] = (now, item)
+        return item
+
     def _check_storage_writable(self) -> CheckItem:
         base = (self.config.get("paths", {}) or {}).get("data_dir", "data")
         try:
-            os.makedirs(base, exist_ok=True)
+            if not os.path.isdir(base):
+                os.makedirs(base, exist_ok=True)
+            # access() answers without touching the flash; the write/remove
+            # probe is only the fallback for filesystems where it lies.
+            if os.access(base, os.W_OK):
+                return CheckItem(name="storage_writable", ok=True, details=f"Writable: {base}")
             test_path = os.path.join(base, ".write_test")
             with open(test_path, "w", encoding="utf-8") as f:
                 f.write(str(time.time()))
@@ -135,12 +266,12 @@ class Diagnostics:
         Soft check: tries to import adc driver and call probe() if available.
         Does not require real I2C in dev environment.
         """
+        cls = _get_adc_cls()
+        if isinstance(cls, Exception):
+            return CheckItem(name="adc_present", ok=False, details=f"ADC import failed: {cls}")
         try:
-            # Local import to avoid hard dependency during unit tests
-            from viscologic.drivers.adc_ads1115 import ADS1115Driver  # type: ignore
-
             adc_cfg = (self.config.get("adc", {}) or {})
-            driver = ADS1115Driver(adc_cfg)
+            driver = cls(adc_cfg)
             ok, details = driver.probe()
             return CheckItem(name="adc_present", ok=ok, details=details)
         except Exception as e:
@@ -148,10 +279,12 @@ class Diagnostics:
 
     def _check_temp_present_soft(self) -> CheckItem:
         try:
-            from viscologic.drivers.temp_max31865 import MAX31865Driver  # type: ignore
+            cls = _get_temp_cls()
+            if isinstance(cls, Exception):
+                raise cls
 
             tcfg = (self.config.get("temp", {}) or {})
-            driver = MAX31865Driver(tcfg)
+            driver = cls(tcfg)
             ok, details = driver.probe()
             return CheckItem(name="temp_present", ok=ok, details=details)
         except Exception as e:
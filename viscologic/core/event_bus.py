@@ -4,18 +4,51 @@
 from __future__ import annotations
 
 import time
-import queue
+import weakref
+import itertools
 import threading
+import collections
 import logging
 from dataclasses import dataclass
-from typing import Any, Callable, Dict, Optional, List
+from typing import Any, Callable, Dict, Optional, List, Tuple
+
+
+_now_ns = time.time_ns
+
+# At most one "command queue full" warning per this interval (drops are
+# still all counted in cmd_dropped_count)
+_CMD_DROP_WARN_NS = 1_000_000_000
 
 
 def now_ms() -> int:
-    return int(time.time() * 1000)
+    return _now_ns() // 1_000_000
+
+
+class _StrongRef:
+    """Same call shape as weakref.ref for callbacks we must keep alive."""
+
+    __slots__ = ("_cb",)
+
+    def __init__(self, cb: Callable[..., Any]):
+        self._cb = cb
 
+    def __call__(self) -> Callable[..., Any]:
+        return self._cb
 
-@dataclass
+
+def _callback_ref(cb: Callable[..., Any], weak: bool = False) -> Callable[[], Optional[Callable[..., Any]]]:
+    """
+    Callbacks are held strongly unless the subscriber asks for weak=True.
+    A weak bound method (e.g. a UI widget's handler) drops out once its
+    object is collected, instead of keeping the widget alive; plain
+    functions/lambdas have nothing else to hang on to, so they stay strong.
+    """
+    if weak and hasattr(cb, "__self__") and hasattr(cb, "__func__"):
+        return weakref.WeakMethod(cb)
+    return _StrongRef(cb)
+
+
+@dataclass(slots=True)
 class Command:
     """
     Unified command model (UI/PLC दोनों इसी format में push करेंगे)
@@ -26,9 +59,9 @@ class Command:
     cmd_type: str               # e.g., "START"
     payload: Dict[str, Any]     # extra parameters (mode, profile_id, etc.)
     seq_id: int = 0             # PLC handshake support (0 ok for local)
-    timestamp_ms: int = 0
+    timestamp_ms: int = 0       # 0 => stamped with now_ms() at creation
 
-    def __post_init__(self):
+    def __post_init__(self) -> None:
         if not self.timestamp_ms:
             self.timestamp_ms = now_ms()
 
@@ -40,41 +73,94 @@ class EventBus:
       2) Command queue maintain करना (UI/PLC -> Orchestrator)
       3) Status snapshot publish (optional)
       4) Thread-safe stop flag
+
+    Frames and status dicts are handed over by reference, never copied:
+    the publisher must not mutate a dict after publishing it, and
+    subscribers / get_latest_*() callers must treat it as read-only
+    (keep the reference, copy only if they need to modify it).
     """
 
+    # Fixed attribute layout: the publish/push/pop paths hit these on every
+    # call, and slots make them plain offset loads instead of dict lookups.
+    __slots__ = (
+        "logger",
+        "_log_debug_enabled",
+        "_frame_slot",
+        "_frame_counter",
+        "_latest_status",
+        "_cmd_q",
+        "cmd_dropped_count",
+        "_cmd_drop_warn_ns",
+        "_cmd_enq_lock",
+        "_cmd_notempty",
+        "_subs_mgmt_lock",
+        "_frame_subs",
+        "_status_subs",
+        "_topic_subs",
+        "_topic_dispatch",
+        "_stop_event",
+        "__weakref__",
+    )
+
     def __init__(self, logger: Optional[logging.Logger] = None, command_queue_max: int = 200):
         self.logger = logger or logging.getLogger("viscologic.event_bus")
-
-        # Latest measurement frame (dict)
-        self._frame_lock = threading.Lock()
-        self._latest_frame: Dict[str, Any] = {
-            "timestamp_ms": now_ms(),
-            "viscosity_cp": 0.0,
-            "temp_c": 25.0,
-            "freq_hz": 0.0,
-            "health_pct": 0,
-            "status_word": 0,
-            "alarm_word": 0,
-        }
-
-        # Optional status snapshot (dict)
-        self._status_lock = threading.Lock()
+        # Checked on the per-event error paths; call refresh_log_level() if
+        # the level changes after the bus is built.
+        self._log_debug_enabled = self.logger.isEnabledFor(logging.DEBUG)
+
+        # Latest measurement frame as (seq, frame): single-slot ring, newest
+        # entry evicts the previous one (append/index are atomic, no lock).
+        # Pollers compare seq to skip frames they have already handled.
+        self._frame_counter = itertools.count(1)
+        self._frame_slot: "collections.deque[Tuple[int, Dict[str, Any]]]" = collections.deque(
+            ((0, {
+                "timestamp_ms": now_ms(),
+                "viscosity_cp": 0.0,
+                "temp_c": 25.0,
+                "freq_hz": 0.0,
+                "health_pct": 0,
+                "status_word": 0,
+                "alarm_word": 0,
+            }),),
+            maxlen=1,
+        )
+
+        # Optional status snapshot (dict, swapped by reference)
         self._latest_status: Dict[str, Any] = {
             "timestamp_ms": now_ms(),
             "state": "BOOTING",
             "message": "Starting",
         }
 
-        # Command queue
-        self._cmd_q: "queue.Queue[Command]" = queue.Queue(maxsize=command_queue_max)
+        # Command queue: many producers (UI/PLC), one consumer (orchestrator).
+        # Bounded ring that drops the *oldest* command when full, so the
+        # latest intent (e.g. STOP) always gets through. Producers serialize
+        # on _cmd_enq_lock only to count drops; the consumer relies on
+        # deque.popleft being atomic and takes no lock.
+        # The Event only matters for the blocking pop_command(timeout_s>0).
+        self._cmd_q: "collections.deque[Command]" = collections.deque(maxlen=max(1, int(command_queue_max)))
+        self.cmd_dropped_count = 0
+        self._cmd_drop_warn_ns = 0
+        self._cmd_enq_lock = threading.Lock()
+        self._cmd_notempty = threading.Event()
 
         # Subscribers (callbacks)
-        self._subs_lock = threading.Lock()
-        self._frame_subs: List[Callable[[Dict[str, Any]], None]] = []
-        self._status_subs: List[Callable[[Dict[str, Any]], None]] = []
+        # Invariant: every subscriber collection is an immutable tuple that is
+        # only ever replaced, never mutated. (Un)subscribe rebuilds it under
+        # _subs_mgmt_lock and assigns the attribute (atomic in CPython), so the
+        # publish paths read it without taking any lock.
+        self._subs_mgmt_lock = threading.Lock()
+        # Frame subscribers are stored as refs (call to resolve, None if dead)
+        self._frame_subs: Tuple[Callable[[], Optional[Callable[[Dict[str, Any]], None]]], ...] = ()
+        self._status_subs: Tuple[Callable[[Dict[str, Any]], None], ...] = ()
         
         # Generic topic-based subscriptions (for backward compatibility)
-        self._topic_subs: Dict[str, List[Callable[[Any], None]]] = {}
+        self._topic_subs: Dict[str, Tuple[Callable[[Any], None], ...]] = {}
+        # Topics with special publish routing; everything else is plain fanout
+        self._topic_dispatch: Dict[str, Callable[[str, Any], None]] = {
+            "frame": self._publish_frame_topic,
+            "ui.frame": self._publish_frame_topic,
+        }
 
         # Stop control
         self._stop_event = threading.Event()
@@ -90,6 +176,10 @@ class EventBus:
     def is_stopped(self) -> bool:
         return self._stop_event.is_set()
 
+    def refresh_log_level(self) -> None:
+        """Re-read the logger level after it was changed at runtime."""
+        self._log_debug_enabled = self.logger.isEnabledFor(logging.DEBUG)
+
     # -----------------------
     # Measurement Frame APIs
     # -----------------------
@@ -99,38 +189,74 @@ class EventBus:
         Store latest measurement frame and notify subscribers.
         Frame is expected to include at least:
           timestamp_ms, viscosity_cp, temp_c, freq_hz, health_pct, status_word, alarm_word
+
+        `frame` is kept by reference (see the class docstring).
         """
         if "timestamp_ms" not in frame:
             frame["timestamp_ms"] = now_ms()
 
-        with self._frame_lock:
-            self._latest_frame = dict(frame)
-            snapshot = self._latest_frame
+        # maxlen=1 drops the stale frame; no lock needed
+        self._frame_slot.append((next(self._frame_counter), frame))
 
         # Notify subscribers (non-blocking best-effort)
-        subs = self._copy_frame_subs()
-        for cb in subs:
-            try:
-                cb(snapshot)
-            except Exception:
-                # Never crash bus due to a bad subscriber
-                self.logger.debug("Frame subscriber error (ignored)", exc_info=True)
+        subs = self._frame_subs
+        if subs:
+            dead = False
+            for ref in subs:
+                cb = ref()
+                if cb is None:
+                    dead = True
+                    continue
+                try:
+                    cb(frame)
+                except Exception:
+                    # Never crash bus due to a bad subscriber
+                    if self._log_debug_enabled:
+                        self.logger.debug("Frame subscriber error (ignored)", exc_info=True)
+            if dead:
+                self._compact_frame_subs()
 
     def get_latest_frame(self) -> Dict[str, Any]:
-        with self._frame_lock:
-            return dict(self._latest_frame)
+        """Latest published frame (shared reference, do not mutate)."""
+        try:
+            return self._frame_slot[0][1]
+        except IndexError:
+            return {}
+
+    def get_latest_frame_seq(self) -> Tuple[int, Dict[str, Any]]:
+        """
+        (seq, frame) for the latest frame, read as one consistent pair.
+        seq increases with every published frame; a poller that sees the
+        same seq as last time can skip the frame.
+        """
+        try:
+            return self._frame_slot[0]
+        except IndexError:
+            return 0, {}
 
-    def subscribe_frames(self, callback: Callable[[Dict[str, Any]], None]) -> None:
-        with self._subs_lock:
-            self._frame_subs.append(callback)
+    def subscribe_frames(self, callback: Callable[[Dict[str, Any]], None], weak: bool = False) -> None:
+        """
+        weak=True holds a bound-method callback weakly: it is dropped when
+        its object is garbage-collected (see _callback_ref).
+        """
+        with self._subs_mgmt_lock:
+            self._frame_subs = self._frame_subs + (_callback_ref(callback, weak),)
 
     def unsubscribe_frames(self, callback: Callable[[Dict[str, Any]], None]) -> None:
-        with self._subs_lock:
-            self._frame_subs = [cb for cb in self._frame_subs if cb != callback]
-
-    def _copy_frame_subs(self) -> List[Callable[[Dict[str, Any]], None]]:
-        with self._subs_lock:
-            return list(self._frame_subs)
+        with self._subs_mgmt_lock:
+            self._frame_subs = tuple(
+                ref for ref in self._frame_subs if ref() is not None and ref() != callback
+            )
+
+    def _compact_frame_subs(self) -> None:
+        # Drop subscribers whose owner was collected. Skip if a (un)subscribe
+        # holds the lock; the next publish will try again.
+        if not self._subs_mgmt_lock.acquire(blocking=False):
+            return
+        try:
+            self._frame_subs = tuple(ref for ref in self._frame_subs if ref() is not None)
+        finally:
+            self._subs_mgmt_lock.release()
 
     # -----------------------
     # Status APIs (optional)
@@ -139,35 +265,31 @@ class EventBus:
     def publish_status(self, status: Dict[str, Any]) -> None:
         """
         Useful for UI banners: e.g., Self-check fail reasons, lock state, etc.
+        Same hand-off contract as publish_frame(): status is kept by reference.
         """
         if "timestamp_ms" not in status:
             status["timestamp_ms"] = now_ms()
 
-        with self._status_lock:
-            self._latest_status = dict(status)
+        self._latest_status = status
 
-        subs = self._copy_status_subs()
-        for cb in subs:
+        for cb in self._status_subs:
             try:
-                cb(self._latest_status)
+                cb(status)
             except Exception:
-                self.logger.debug("Status subscriber error (ignored)", exc_info=True)
+                if self._log_debug_enabled:
+                    self.logger.debug("Status subscriber error (ignored)", exc_info=True)
 
     def get_latest_status(self) -> Dict[str, Any]:
-        with self._status_lock:
-            return dict(self._latest_status)
+        """Latest published status (shared reference, do not mutate)."""
+        return self._latest_status
 
     def subscribe_status(self, callback: Callable[[Dict[str, Any]], None]) -> None:
-        with self._subs_lock:
-            self._status_subs.append(callback)
+        with self._subs_mgmt_lock:
+            self._status_subs = self._status_subs + (callback,)
 
     def unsubscribe_status(self, callback: Callable[[Dict[str, Any]], None]) -> None:
-        with self._subs_lock:
-            self._status_subs = [cb for cb in self._status_subs if cb != callback]
-
-    def _copy_status_subs(self) -> List[Callable[[Dict[str, Any]], None]]:
-        with self._subs_lock:
-            return list(self._status_subs)
+        with self._subs_mgmt_lock:
+            self._status_subs = tuple(cb for cb in self._status_subs if cb != callback)
 
     # -----------------------
     # Command Queue APIs
@@ -182,18 +304,30 @@ class EventBus:
     ) -> bool:
         """
         Push a command into queue (UI/PLC call this).
-        Returns True if enqueued, False if dropped due to full queue.
+        Always enqueues and returns True; if the queue is full the oldest
+        pending command is evicted, cmd_dropped_count is incremented and a
+        (rate-limited) warning is logged. Callers that must know about lost
+        commands compare cmd_dropped_count.
         """
         payload = payload or {}
         cmd = Command(source=source, cmd_type=cmd_type, payload=payload, seq_id=seq_id)
 
-        try:
-            self._cmd_q.put_nowait(cmd)
-            return True
-        except queue.Full:
-            # Drop newest command to avoid blocking UI/PLC threads
-            self.logger.warning("Command queue full, dropping cmd=%s source=%s", cmd_type, source)
-            return False
+        q = self._cmd_q
+        with self._cmd_enq_lock:
+            dropped = len(q) == q.maxlen
+            q.append(cmd)
+            if dropped:
+                self.cmd_dropped_count += 1
+        self._cmd_notempty.set()
+        if dropped:
+            t = _now_ns()
+            if t >= self._cmd_drop_warn_ns:
+                self._cmd_drop_warn_ns = t + _CMD_DROP_WARN_NS
+                self.logger.warning(
+                    "Command queue full, dropped oldest pending command to enqueue cmd=%s source=%s "
+                    "(%d dropped so far)", cmd_type, source, self.cmd_dropped_count,
+                )
+        return True
 
     def pop_command(self, timeout_s: float = 0.0) -> Optional[Command]:
         """
@@ -202,25 +336,45 @@ class EventBus:
         """
         if self.is_stopped():
             return None
+        if timeout_s and timeout_s > 0:
+            self._cmd_notempty.wait(timeout_s)
         try:
-            if timeout_s and timeout_s > 0:
-                return self._cmd_q.get(timeout=timeout_s)
-            return self._cmd_q.get_nowait()
-        except queue.Empty:
+            cmd = self._cmd_q.popleft()
+        except IndexError:
+            self._mark_cmd_drained()
             return None
+        if not self._cmd_q:
+            self._mark_cmd_drained()
+        return cmd
 
     def drain_commands(self, max_items: int = 100) -> List[Command]:
         """
         Fetch up to max_items commands at once (useful for batch processing).
         """
-        items: List[Command] = []
-        for _ in range(max_items):
-            cmd = self.pop_command(timeout_s=0.0)
-            if cmd is None:
-                break
-            items.append(cmd)
+        if self.is_stopped():
+            return []
+        q = self._cmd_q
+        if not q:
+            return []
+        # One critical section per drain: holding the producer lock lets us
+        # take the whole backlog with list()+clear() without losing a push.
+        with self._cmd_enq_lock:
+            if max_items >= len(q):
+                items = list(q)
+                q.clear()
+            else:
+                popleft = q.popleft
+                items = [popleft() for _ in range(max_items)]
+        if not q:
+            self._mark_cmd_drained()
         return items
 
+    def _mark_cmd_drained(self) -> None:
+        self._cmd_notempty.clear()
+        # A producer may have appended between our empty check and clear()
+        if self._cmd_q:
+            self._cmd_notempty.set()
+
     # -----------------------
     # Generic Topic-Based API (for backward compatibility)
     # -----------------------
@@ -237,17 +391,36 @@ class EventBus:
         if not topic or not callable(callback):
             return
         
-        with self._subs_lock:
+        with self._subs_mgmt_lock:
             # Special case: frame topics also register as frame subscribers
             if topic in ("frame", "ui.frame"):
-                if callback not in self._frame_subs:
-                    self._frame_subs.append(callback)
+                if all(ref() != callback for ref in self._frame_subs):
+                    self._frame_subs = self._frame_subs + (_callback_ref(callback),)
             else:
                 # Generic topic-based subscription
-                if topic not in self._topic_subs:
-                    self._topic_subs[topic] = []
-                if callback not in self._topic_subs[topic]:
-                    self._topic_subs[topic].append(callback)
+                subs = self._topic_subs.get(topic, ())
+                if callback not in subs:
+                    self._topic_subs[topic] = subs + (callback,)
+
+    def unsubscribe(self, topic: str, callback: Callable[[Any], None]) -> None:
+        """
+        Counterpart of subscribe(). Only the one topic's tuple is rebuilt;
+        publishers on other topics never see the change.
+        """
+        if not topic:
+            return
+
+        with self._subs_mgmt_lock:
+            if topic in ("frame", "ui.frame"):
+                self._frame_subs = tuple(
+                    ref for ref in self._frame_subs if ref() is not None and ref() != callback
+                )
+                return
+            subs = tuple(cb for cb in self._topic_subs.get(topic, ()) if cb != callback)
+            if subs:
+                self._topic_subs[topic] = subs
+            else:
+                self._topic_subs.pop(topic, None)
 
     def publish(self, topic: str, payload: Any = None) -> None:
         """
@@ -261,18 +434,24 @@ class EventBus:
         if not topic:
             return
         
+        # Routing is fixed per topic, so resolve it with one lookup instead
+        # of testing every publish for the special frame topics.
+        self._topic_dispatch.get(topic, self._publish_topic_default)(topic, payload)
+
+    def _publish_frame_topic(self, topic: str, payload: Any) -> None:
         # Special case: frame topics also use publish_frame
-        if topic in ("frame", "ui.frame") and isinstance(payload, dict):
+        if isinstance(payload, dict):
             self.publish_frame(payload)
-            return
-        
-        # Notify topic subscribers
-        with self._subs_lock:
-            callbacks = list(self._topic_subs.get(topic, []))
-        
-        # Call callbacks (non-blocking best-effort)
-        for cb in callbacks:
+        else:
+            self._publish_topic_default(topic, payload)
+
+    def _publish_topic_default(self, topic: str, payload: Any) -> None:
+        # Notify topic subscribers (non-blocking best-effort). Each topic owns
+        # an immutable tuple, so this read needs no lock and topics never
+        # contend with each other.
+        for cb in self._topic_subs.get(topic, ()):
             try:
                 cb(payload)
             except Exception:
-                self.logger.debug("Topic subscriber error (ignored)", exc_info=True)
+                if self._log_debug_enabled:
+                    self.logger.debug("Topic subscriber error (ignored)", exc_info=True)
@@ -14,16 +14,22 @@ Responsibilities:
 from __future__ import annotations
 
 import os
+import math
+import random
 import time
 import logging
 import json
+import struct
+import collections
+import operator
+import functools
 import threading
-from dataclasses import dataclass, asdict
-from typing import Any, Dict, Optional, Tuple
+from dataclasses import dataclass, fields
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from viscologic.core.state_machine import SystemStateMachine, SystemState
 from viscologic.core.safety_manager import SafetyManager
-from viscologic.core.diagnostics import Diagnostics
+from viscologic.core.diagnostics import Diagnostics, DiagSample
 
 from viscologic.security.commissioning_manager import CommissioningManager
 
@@ -40,7 +46,13 @@ from viscologic.model.calibration_lut import CalibrationLUT
 from viscologic.model.viscosity_compute import ViscosityCompute
 from viscologic.model.temp_compensation import TempCompensation
 
-from viscologic.protocols.register_map import RegisterBank
+from viscologic.protocols.register_map import (
+    RegisterBank,
+    STATUS_SYSTEM_READY, STATUS_SWEEPING, STATUS_LOCKED, STATUS_PAUSED,
+    STATUS_FAULT_LATCHED, STATUS_REMOTE_ENABLED,
+    CONTROL_BIT_START, CONTROL_BIT_STOP, CONTROL_BIT_ACK, CONTROL_BIT_RESET,
+    ALARM_LOST_LOCK,
+)
 from viscologic.protocols.modbus_server import ModbusServer
 
 from viscologic.storage.sqlite_store import SqliteStore
@@ -48,7 +60,7 @@ from viscologic.storage.csv_logger import CsvLogger
 from viscologic.storage.retention import RetentionManager
 
 
-@dataclass
+@dataclass(slots=True)
 class RuntimeSnapshot:
     ts: float = 0.0
     state: str = "IDLE"
@@ -82,6 +94,137 @@ class RuntimeSnapshot:
 
     active_profile: str = "Default"
 
+    def to_dict(self) -> Dict[str, Any]:
+        # Shallow field copy (one C-level attrgetter call), not the recursive asdict
+        return dict(zip(_SNAPSHOT_FIELDS, _snapshot_values(self)))
+
+
+_SNAPSHOT_FIELDS = tuple(f.name for f in fields(RuntimeSnapshot))
+_snapshot_values = operator.attrgetter(*_SNAPSHOT_FIELDS)
+
+
+@functools.lru_cache(maxsize=None)
+def _cfg_path(key: str) -> Tuple[str, ...]:
+    # Config keys are a small fixed set of literals; split each one once
+    return tuple(key.split("."))
+
+
+def _dict_step(d: Any, k: str) -> Any:
+    return d.get(k) if isinstance(d, dict) else None
+
+
+# Registers _publish_modbus writes, in layout() names
+_MB_PUBLISH_REGS = (
+    "STATUS_WORD",
+    "VISCOSITY_F32_HI", "VISCOSITY_F32_LO",
+    "TEMP_C_F32_HI", "TEMP_C_F32_LO",
+    "FREQ_HZ_F32_HI", "FREQ_HZ_F32_LO",
+    "MAG_F32_HI", "MAG_F32_LO",
+    "CONFIDENCE_F32_HI", "CONFIDENCE_F32_LO",
+)
+_U16X10 = struct.Struct(">10H")
+
+# Published STATUS_WORD bits (same result as RegisterBank.encode_status_word)
+_SW_READY = 1 << STATUS_SYSTEM_READY
+_SW_RUNNING = 1 << STATUS_SWEEPING
+_SW_LOCKED = 1 << STATUS_LOCKED
+_SW_FAULT = 1 << STATUS_FAULT_LATCHED
+_SW_REMOTE = 1 << STATUS_REMOTE_ENABLED
+
+# CONTROL_WORD command bits acted on by _poll_modbus_commands
+_CW_START = 1 << CONTROL_BIT_START
+_CW_STOP = 1 << CONTROL_BIT_STOP
+_CW_ACK = 1 << CONTROL_BIT_ACK
+_CW_RESET = 1 << CONTROL_BIT_RESET
+_CW_COMMANDS = _CW_START | _CW_STOP | _CW_ACK | _CW_RESET
+
+
+def _contiguous_runs(addrs: Any) -> Tuple[Tuple[int, Tuple[int, ...]], ...]:
+    """Group _MB_PUBLISH_REGS by address into (base_addr, reg_indices) runs."""
+    pairs = sorted(
+        (addr, i) for i, addr in enumerate(addrs) if addr is not None
+    )
+    runs = []
+    for addr, i in pairs:
+        if runs and addr == runs[-1][0] + len(runs[-1][1]):
+            runs[-1][1].append(i)
+        else:
+            runs.append((addr, [i]))
+    return tuple((base, tuple(idx)) for base, idx in runs)
+
+
+# State-derived part of the logged status word; other states contribute 0
+_STATE_STATUS_BITS: Dict[SystemState, int] = {
+    SystemState.SWEEPING: 1 << STATUS_SWEEPING,
+    SystemState.LOCKING: 1 << STATUS_SWEEPING,
+    SystemState.RUNNING: 1 << STATUS_SWEEPING,
+    SystemState.PAUSED: 1 << STATUS_PAUSED,
+    SystemState.FAULT: 1 << STATUS_FAULT_LATCHED,
+}
+
+# Unchanged UI frames are republished at least this often (heartbeat)
+_FRAME_HEARTBEAT_S = 1.0
+
+# State groups tested every tick (hash lookup instead of a tuple scan)
+_RUNNING_STATES = frozenset((SystemState.SWEEPING, SystemState.LOCKING, SystemState.RUNNING))
+_DUTY_ZERO_STATES = frozenset((SystemState.IDLE, SystemState.STOPPING, SystemState.FAULT))
+
+_STATE_NAME: Dict[SystemState, str] = {st: st.name for st in SystemState}
+
+# Sample log queue: ring size, early-flush threshold, rows per write batch
+_LOG_QUEUE_MAX = 4096
+_LOG_HIGH_WATER = 256
+_LOG_BATCH_MAX = 256
+
+# runtime_state.bin record: running flag, wall-clock ts of the last change
+_RUNTIME_STATE = struct.Struct(">?d")
+
+# How often the tick loop re-derives wall time from the monotonic clock
+_EPOCH_REANCHOR_NS = 60 * 1_000_000_000
+
+
+def _fallback_confidence(mag: float, locked: bool) -> float:
+    # Used when HealthScorer is unavailable or fails
+    base = 80.0 if locked else 40.0
+    if mag <= 0.0001:
+        base -= 30.0
+    return max(0.0, min(100.0, base))
+
+
+def _mock_viscosity(mag: float, now: float) -> float:
+    # DEV MOCK: viscosity from mag; a sine wave when there is no ADC signal
+    if mag < 0.0001:
+        return abs(math.sin(now) * 100.0) + 50.0
+    return max(0.0, 1000.0 * mag)
+
+
+def _lower(v: Any) -> str:
+    return str(v).lower()
+
+
+def _in_range(lo: float, hi: float, lo_inclusive: bool = True) -> Callable[[float], bool]:
+    if lo_inclusive:
+        return lambda v: lo <= v <= hi
+    return lambda v: lo < v <= hi
+
+
+# Engineer Screen settings: payload key -> (config path, coerce, validate,
+# Orchestrator side-effect method name or None)
+_SETTINGS_HANDLERS: Dict[str, Tuple[str, Callable[[Any], Any], Callable[[Any], bool], Optional[str]]] = {
+    "mode": ("app.mode", _lower, ("tabletop", "inline").__contains__, "_on_mode_setting"),
+    "control_source": ("app.control_source", _lower, ("local", "remote", "mixed").__contains__, None),
+    "remote_enable": ("protocols.remote_enable", bool, lambda v: True, None),
+    "comm_loss_action": ("protocols.comm_loss_action", _lower,
+                         ("safe_stop", "hold_last", "pause").__contains__, "_on_comm_loss_setting"),
+    "inline_auto_resume": ("app.inline_auto_resume", bool, lambda v: True, None),
+    "max_current_ma": ("safety.max_current_ma", float, _in_range(1, 500), "_on_safety_limit_setting"),
+    "max_temp_c": ("safety.max_temp_c", float, _in_range(1, 200), "_on_safety_limit_setting"),
+    "target_freq_hz": ("dsp.target_freq_hz", float, _in_range(1, 1000), None),
+    "sweep_span_hz": ("dsp.sweep_span_hz", float, _in_range(0, 200, lo_inclusive=False), None),
+    "sweep_step_hz": ("dsp.sweep_step_hz", float, _in_range(0, 10, lo_inclusive=False), None),
+    "lockin_tau_s": ("dsp.lockin_tau_s", float, _in_range(0, 10, lo_inclusive=False), None),
+}
+
 
 class Orchestrator:
     def __init__(
@@ -95,6 +238,8 @@ class Orchestrator:
         self.config = config
         self.bus = bus
         self.logger = logger or logging.getLogger("viscologic.orchestrator")
+        # Hot-path debug lines check this flag instead of calling into logging
+        self._log_debug_enabled = self.logger.isEnabledFor(logging.DEBUG)
 
         # --- Initialize SQLite FIRST ---
         db_path = "data/viscologic.db"
@@ -102,7 +247,11 @@ class Orchestrator:
         if val: 
             db_path = str(val)
 
-        self.sqlite = SqliteStore(db_path, logger=self.logger)
+        self.sqlite = SqliteStore(
+            db_path,
+            logger=self.logger,
+            synchronous=str(self._cfg_get("storage.sqlite.synchronous", "NORMAL")),
+        )
         # Initialize database schema
         try:
             self.sqlite.init_db()
@@ -113,6 +262,7 @@ class Orchestrator:
         self.sm = SystemStateMachine()
         self.safety = SafetyManager(self.config)
         self.diag = Diagnostics(self.config, self.logger)
+        self._diag_sample = DiagSample()
         self.commissioning = CommissioningManager(self.sqlite, self.config, self.logger)
 
         self.regmap = RegisterBank()
@@ -121,7 +271,9 @@ class Orchestrator:
         csv_path = str(self._cfg_get("storage.csv_logger.folder", "logs"))
         self.csv = CsvLogger(
             csv_dir=csv_path,
-            logger=self.logger
+            logger=self.logger,
+            flush_interval_s=float(self._cfg_get("storage.csv_logger.flush_interval_s", 1.0)),
+            fsync_interval_s=float(self._cfg_get("storage.csv_logger.fsync_interval_s", 0.0)),
         )
 
         # --- Retention Init ---
@@ -167,6 +319,7 @@ class Orchestrator:
                 "rate": int(self._cfg_get("drivers.audio.rate", 44100)),
                 "output_device_index": self._cfg_get("drivers.audio.output_device_index"),
                 "gain": float(self._cfg_get("drivers.audio.output_gain", 1.0)),
+                "blocksize": int(self._cfg_get("drivers.audio.output_blocksize", 0)),
             }
             self.drive = AudioDriveDriver(cfg=audio_drv_cfg, logger=self.logger)
         else:
@@ -180,6 +333,15 @@ class Orchestrator:
             }
             self.drive = DrivePWM(cfg=drive_cfg, logger=self.logger)
 
+        # DEV MOCK (default on for desktop testing): fake ADC noise / viscosity.
+        # Read once, not per tick.
+        self._mock_mode = os.environ.get("MOCK_MODE", "1") == "1"
+        self._rand = random.uniform
+        # Strategy picked once so the per-tick path carries no mock branch
+        self._compute_viscosity = (
+            self._compute_viscosity_mock if self._mock_mode else self._compute_viscosity_real
+        )
+
         # --- Temp Config ---
         temp_cfg = {
             "cs_pin": self._cfg_get("drivers.temp_max31865.spi_cs", 0),
@@ -190,6 +352,15 @@ class Orchestrator:
             "required": True
         }
         self.temp = MAX31865Temp(cfg=temp_cfg, logger=self.logger)
+        # A MAX31865 one-shot conversion blocks for tens of ms, so once
+        # started the sensor is read only on its own thread and the tick takes
+        # the latest (temp_c, fault, monotonic_ns) sample. A sample older than
+        # a few poll intervals (poller hung or dead) is treated as a fault.
+        self._temp_poll_s = max(0.05, float(self._cfg_get("drivers.temp_max31865.poll_interval_s", 0.25)))
+        self._temp_stale_ns = int(max(1.0, 4.0 * self._temp_poll_s) * 1e9)
+        self._temp_latest: Optional[Tuple[float, bool, int]] = None
+        self._temp_stale_logged = False
+        self._temp_poller: Optional[threading.Thread] = None
 
         # 5. DSP / Model
         self._fs_hz = float(self._cfg_get("app.sample_rate_hz", 200))
@@ -243,17 +414,92 @@ class Orchestrator:
         # --- Modbus Init ---
         self.modbus = ModbusServer(self.config, self.bus, self.logger)
 
+        # Live values are packed into these buffers each tick; the Modbus
+        # server copies them into its registers from its own thread.
+        self._mb_status = struct.Struct(">H")
+        self._mb_status_buf = bytearray(self._mb_status.size)
+        self._mb_f32 = struct.Struct(">5f")  # VISCOSITY, TEMP_C, FREQ_HZ, MAG, CONFIDENCE
+        self._mb_f32_buf = bytearray(self._mb_f32.size)
+        self._mb_f32_pack = self._mb_f32.pack_into
+        self._mb_u16_unpack = _U16X10.unpack_from
+        self._mb_live = False
+        # Register layout is static; resolve it once
+        self._mb_layout = self.regmap.layout()
+        self._mb_control_word_addr = self._mb_layout.get("CONTROL_WORD")
+        self._mb_publish_runs = _contiguous_runs(
+            self._mb_layout.get(name) for name in _MB_PUBLISH_REGS
+        )
+        try:
+            if hasattr(self.modbus, "attach_live_block"):
+                layout = self._mb_layout
+                self.modbus.attach_live_block(layout["STATUS_WORD"], self._mb_status_buf)
+                self.modbus.attach_live_block(layout["VISCOSITY_F32_HI"], self._mb_f32_buf)
+                self._mb_live = True
+        except Exception as e:
+            self.logger.warning("Modbus live block unavailable, using per-register writes: %s", e)
+        self._mb_write_many = getattr(self.modbus, "write_multiple_registers", None)
+        self._mb_write_one = getattr(self.modbus, "set_holding_register", None) or getattr(
+            self.modbus, "write_holding_register", None
+        )
+
         self._stop = threading.Event()
         self._thread: Optional[threading.Thread] = None
+        self._epoch_ns = 0
+        self._anchor_epoch()
+        # Ping-pong pair: _tick fills the scratch instance, then swaps it
+        # with the published one (a single reference store).
         self._snapshot = RuntimeSnapshot()
-        self._snapshot_lock = threading.Lock()
+        self._snapshot_scratch = RuntimeSnapshot()
+        # Bumped after every swap; readers retry if it moved under them
+        self._snapshot_seq = 0
+        # Rendered-field fingerprint of the last frame put on the bus
+        self._frame_fp: Optional[Tuple[Any, ...]] = None
+        self._frame_pub_ts = 0.0
 
         self._last_control_word: int = 0
         self._last_cmd_source: str = "local"
 
-        self._runtime_state_path = "data/runtime_state.json"
+        # Sample logging is off the tick thread: _log only appends a tuple
+        # to this bounded ring (drop-oldest if the disk stalls). The log
+        # writer drains it every flush interval, or early once the backlog
+        # reaches _LOG_HIGH_WATER, in batches of up to _LOG_BATCH_MAX rows
+        # (one CSV writerows() + one SQLite transaction per batch).
+        self._log_q: "collections.deque[Tuple[Any, ...]]" = collections.deque(maxlen=_LOG_QUEUE_MAX)
+        self._log_wake = threading.Event()
+        # Drop accounting without a lock: the tick thread only ever bumps
+        # _log_dropped (running total); the writer only ever writes
+        # _log_dropped_reported and logs the difference.
+        self._log_dropped = 0
+        self._log_dropped_reported = 0
+        self._log_flush_s = max(0.05, float(self._cfg_get("storage.sqlite.flush_interval_s", 1.0)))
+        self._log_writer: Optional[threading.Thread] = None
+        # Writer-thread scratch frame, refilled per row (CsvLogger turns each
+        # frame into a row before asking for the next one)
+        self._log_frame_buf: Dict[str, Any] = {}
+
+        self._runtime_state_path = "data/runtime_state.bin"
+        self._legacy_runtime_state_path = "data/runtime_state.json"
+        self._last_persisted_running: Optional[bool] = None
+        # Tick-side requests for the log writer thread, which owns the
+        # runtime-state file write and the retention folder scan
+        self._runtime_running: Optional[bool] = None
+        self._ret_last_ts = 0.0
+        self._ret_due = False
         self._ensure_folders()
 
+        # Values read on every tick; refreshed from config on settings changes
+        self._mode: str = "tabletop"
+        self._control_source: str = "mixed"
+        self._remote_enabled: bool = True
+        self._tick_dt: float = 0.005
+        self._min_confidence_ok: float = 60.0
+        self._active_profile: str = "Default"
+        self._cfg_version = 0
+        self._refresh_hot_config()
+        self._cfg_cache_ver = self._cfg_version
+
+        self._bind_lifecycle()
+        self._bind_fastpaths()
         self._wire_bus()
 
         # Apply config mode to SM
@@ -275,58 +521,147 @@ class Orchestrator:
 
         # 2. If it's a dictionary (or fallback), traverse dots manually
         if isinstance(self.config, dict):
-            parts = key.split(".")
-            curr = self.config
-            try:
-                for p in parts:
-                    if isinstance(curr, dict):
-                        curr = curr.get(p)
-                    else:
-                        return default
-                return curr if curr is not None else default
-            except Exception:
-                return default
-        
+            val = functools.reduce(_dict_step, _cfg_path(key), self.config)
+            return default if val is None else val
+
         return default
 
+    def _cfg_set(self, key: str, value: Any) -> None:
+        # ConfigManager.set when available, else write into the plain dict
+        setter = getattr(self.config, "set", None)
+        if callable(setter):
+            setter(key, value)
+        elif isinstance(self.config, dict):
+            *parents, leaf = _cfg_path(key)
+            curr = self.config
+            for p in parents:
+                curr = curr.setdefault(p, {})
+            curr[leaf] = value
+
+    def _refresh_hot_config(self) -> None:
+        """Re-read the config values _tick uses every cycle into attributes."""
+        self._mode = str(self._cfg_get("app.mode", "tabletop"))
+        self._control_source = str(self._cfg_get("app.control_source", "mixed"))
+        self._remote_enabled = bool(self._cfg_get("protocols.remote_enable", True))
+        tick_hz = float(self._cfg_get("app.sample_rate_hz", 200))
+        self._tick_dt = 1.0 / max(10.0, min(2000.0, tick_hz))
+        self._min_confidence_ok = float(self._cfg_get("health.min_confidence_ok", 60.0))
+        self._active_profile = str(self._cfg_get("calibration.active_profile", "Default"))
+        self._start_duty = float(self._cfg_get("drivers.drive_pwm.start_duty", 0.15))
+        self._max_drive_duty = float(self._cfg_get("safety.max_drive_duty", 0.85))
+        self._max_temp_c = float(self._cfg_get("safety.max_temp_c", 80.0))
+        self._remote_start_edge = bool(self._cfg_get("plc.remote_start_edge", True))
+        self._remote_stop_edge = bool(self._cfg_get("plc.remote_stop_edge", True))
+        self._csv_enabled = bool(self._cfg_get("storage.csv_logger.enabled", True))
+        self._sqlite_enabled = bool(self._cfg_get("storage.sqlite.enabled", True))
+        self._rebind_tick_steps()
+
+    def bump_cfg(self) -> None:
+        """
+        Mark the config as changed (e.g. after a reload). The tick thread
+        re-reads its cached values at the start of the next tick.
+        """
+        self._cfg_version += 1
+
+    def _rebind_tick_steps(self) -> None:
+        """
+        Pick the config-dependent _tick steps once, so the steady-state tick
+        doesn't re-test settings that only change from the UI/PLC.
+        """
+        remote = self._remote_enabled and self._control_source in ("remote", "mixed")
+        self._remote_poll = self._poll_modbus_commands if remote else None
+
     # ------------------------
     # Public control
     # ------------------------
+    def _bind_lifecycle(self) -> None:
+        # Optional component hooks, resolved once; None when a driver lacks one
+        self._commission_ensure = getattr(self.commissioning, "ensure_commissioned", None)
+        self._modbus_start = getattr(self.modbus, "start", None)
+        self._modbus_stop = getattr(self.modbus, "stop", None)
+        self._csv_start = getattr(self.csv, "start", None)
+        self._csv_stop = getattr(self.csv, "stop", None)
+        self._drive_set_duty = getattr(self.drive, "set_duty", None)
+        self._drive_stop = getattr(self.drive, "stop", None)
+        self._safety_ack = getattr(self.safety, "acknowledge_alarms", None)
+        self._safety_reset = getattr(self.safety, "reset_alarms", None)
+        # Read by every tick's snapshot/frame
+        self._safety_alarms = getattr(self.safety, "alarms", None)
+        self._safety_fault_latched = getattr(self.safety, "fault_latched", None)
+        self._safety_is_ack = getattr(self.safety, "is_acknowledged", None)
+        self._csv_is_enabled = getattr(self.csv, "is_enabled", None)
+
+    def _bind_fastpaths(self) -> None:
+        # Per-tick driver/model hooks, resolved once (None = not provided)
+        self._temp_read_c = getattr(self.temp, "read_temp_c", None)
+        self._temp_read = getattr(self.temp, "read", None)  # older driver interface
+        self._adc_read = getattr(self.adc, "read_sample_volts", None) or getattr(self.adc, "read", None)
+        self._drive_set_freq = getattr(self.drive, "set_frequency", None)
+        self._drive_set_level = getattr(self.drive, "set_duty", None) or getattr(self.drive, "set_amplitude", None)
+        self._drive_get_duty = getattr(self.drive, "get_duty", None)
+        self._sm_is_locked = getattr(self.sm, "is_locked", None)
+        self._sweep_current_freq = getattr(self.sweep, "get_current_freq", None)
+        self._safety_eval = getattr(self.safety, "evaluate", None)
+        self._health_compute = getattr(self.health, "compute", None)
+        self._cal_active_set_id = getattr(self.cal_store, "get_active_set_id", None)
+        self._visc_compute = getattr(self.visc_compute, "compute", None)
+        self._bus_publish_frame = getattr(self.bus, "publish_frame", None)
+        self._modbus_get_hr = getattr(self.modbus, "get_holding_register", None) or getattr(
+            self.modbus, "read_holding_register", None
+        )
+
+    def _call_quiet(self, fn: Any, *args: Any) -> None:
+        # Best-effort lifecycle call: missing hook or failure is non-fatal
+        if fn is None:
+            return
+        try:
+            fn(*args)
+        except Exception as e:
+            if self._log_debug_enabled:
+                self.logger.debug("%s failed: %s", getattr(fn, "__qualname__", fn), e)
+
+    def refresh_log_level(self) -> None:
+        """Re-read the logger level after it was changed at runtime."""
+        self._log_debug_enabled = self.logger.isEnabledFor(logging.DEBUG)
+        if hasattr(self.bus, "refresh_log_level"):
+            self.bus.refresh_log_level()
+
     def start(self) -> None:
         """Start modbus + start orchestrator loop in background thread."""
         self._stop.clear()
+        self._anchor_epoch()
 
         # Ensure commissioning lock is satisfied
-        try:
-            if hasattr(self.commissioning, "ensure_commissioned"):
-                self.commissioning.ensure_commissioned()
-                self.logger.info("SM Init State: %s", self.sm.state)
-
-        except Exception:
-            pass
+        if self._commission_ensure is not None:
+            self._call_quiet(self._commission_ensure)
+            self.logger.info("SM Init State: %s", self.sm.state)
 
         # Start modbus server (best effort)
-        try:
-            if bool(self._cfg_get("protocols.modbus_server.enabled", True)):
-                if hasattr(self.modbus, "start"):
-                    self.modbus.start()
-        except Exception:
-            pass
+        if bool(self._cfg_get("protocols.modbus_server.enabled", True)):
+            self._call_quiet(self._modbus_start)
 
-        # Start CSV logger (best effort)
-        # Start CSV logger (best effort)
-        try:
-            # Only auto-start if explicitly configured
-            if bool(self._cfg_get("storage.csv_logger.enabled", True)):
-                if bool(self._cfg_get("storage.csv_logger.auto_start", False)):
-                    if hasattr(self.csv, "start"):
-                        self.csv.start()
-        except Exception:
-            pass
+        # Start CSV logger (best effort); only auto-start if explicitly configured
+        if bool(self._cfg_get("storage.csv_logger.enabled", True)):
+            if bool(self._cfg_get("storage.csv_logger.auto_start", False)):
+                self._call_quiet(self._csv_start)
 
         # Auto-resume (inline mode only, commissioned only)
         self._apply_auto_resume_policy()
 
+        self._log_writer = threading.Thread(
+            target=self._log_writer_loop, name="ViscoLogic-LogWriter", daemon=True
+        )
+        self._log_writer.start()
+
+        # First sample taken here so the tick never has to read the sensor
+        # itself (the driver has no lock; the poller owns it from now on)
+        self._temp_latest = (*self._read_temperature(), time.monotonic_ns())
+        self._temp_stale_logged = False
+        self._temp_poller = threading.Thread(
+            target=self._temp_poll_loop, name="ViscoLogic-TempPoll", daemon=True
+        )
+        self._temp_poller.start()
+
         self._thread = threading.Thread(target=self._run_loop, name="ViscoLogic-Orchestrator", daemon=True)
         self._thread.start()
 
@@ -336,38 +671,35 @@ class Orchestrator:
         if self._thread and self._thread.is_alive():
             self._thread.join(timeout=2.0)
 
-        # safe stop drive
-        try:
-            if hasattr(self.drive, "set_duty"):
-                self.drive.set_duty(0.0)
-        except Exception:
-            pass
-
-        try:
-            if hasattr(self.drive, "stop"):
-                self.drive.stop()
-        except Exception:
-            pass
+        # Wake the writer so it sees _stop; write whatever the last ticks queued
+        self._log_wake.set()
+        if self._log_writer and self._log_writer.is_alive():
+            self._log_writer.join(timeout=2.0)
+        self._drain_log_queue()
+        if self._temp_poller and self._temp_poller.is_alive():
+            self._temp_poller.join(timeout=2.0)
+        self._temp_latest = None
 
-        # stop modbus
-        try:
-            if hasattr(self.modbus, "stop"):
-                self.modbus.stop()
-        except Exception:
-            pass
+        # safe stop drive
+        self._call_quiet(self._drive_set_duty, 0.0)
+        self._call_quiet(self._drive_stop)
 
-        # stop CSV logger
-        try:
-            if hasattr(self.csv, "stop"):
-                self.csv.stop()
-        except Exception:
-            pass
+        # stop modbus + CSV logger
+        self._call_quiet(self._modbus_stop)
+        self._call_quiet(self._csv_stop)
 
         self._persist_runtime_state(running=False)
 
     def get_snapshot(self) -> Dict[str, Any]:
-        with self._snapshot_lock:
-            return asdict(self._snapshot)
+        # Lock-free read: the published instance is only refilled one tick
+        # after it was swapped out, so an unchanged sequence number means
+        # the copy came from a buffer the tick thread wasn't touching.
+        for _ in range(4):
+            seq = self._snapshot_seq
+            out = self._snapshot.to_dict()
+            if self._snapshot_seq == seq:
+                return out
+        return out
 
     # UI calls
     def ui_start(self) -> None:
@@ -388,20 +720,21 @@ class Orchestrator:
 
     def ui_set_mode(self, mode: str) -> None:
         mode = "inline" if mode == "inline" else "tabletop"
-        if hasattr(self.config, "set") and callable(getattr(self.config, "set", None)):
-            self.config.set("app.mode", mode)  # type: ignore
-        elif isinstance(self.config, dict):
-            try: self.config["app"]["mode"] = mode 
-            except: pass
+        try:
+            self._cfg_set("app.mode", mode)
+        except Exception:
+            pass
+        self._mode = mode
         self.sm.set_mode(mode)
 
     def ui_set_control_source(self, src: str) -> None:
         src = src if src in ("local", "remote", "mixed") else "mixed"
-        if hasattr(self.config, "set") and callable(getattr(self.config, "set", None)):
-            self.config.set("app.control_source", src)  # type: ignore
-        elif isinstance(self.config, dict):
-            try: self.config["app"]["control_source"] = src
-            except: pass
+        try:
+            self._cfg_set("app.control_source", src)
+        except Exception:
+            pass
+        self._control_source = src
+        self._rebind_tick_steps()
 
     # ------------------------
     # Internals
@@ -442,20 +775,20 @@ class Orchestrator:
             self.sm.handle_event("STOP", {"source": self._last_cmd_source})
         elif cmd == "ALARM_ACK":
             # Mark alarms as acknowledged (silences buzzer, UI state change)
-            if hasattr(self.safety, "acknowledge_alarms"):
-                self.safety.acknowledge_alarms()
+            if self._safety_ack is not None:
+                self._safety_ack()
             self.sm.handle_event("ALARM_ACK", {"source": self._last_cmd_source})
         elif cmd == "ALARM_RESET":
             # FIXED: Must reset safety latch too!
-            if hasattr(self.safety, "reset_alarms"):
-                self.safety.reset_alarms()
+            if self._safety_reset is not None:
+                self._safety_reset()
             self.sm.handle_event("ALARM_RESET", {"source": self._last_cmd_source})
         elif cmd == "LOG_START":
-            if hasattr(self.csv, "start"):
-                self.csv.start()
+            if self._csv_start is not None:
+                self._csv_start()
         elif cmd == "LOG_STOP":
-            if hasattr(self.csv, "stop"):
-                self.csv.stop()
+            if self._csv_stop is not None:
+                self._csv_stop()
         elif cmd == "EXPORT":
             import threading
             threading.Thread(target=self._run_export, daemon=True).start()
@@ -487,99 +820,42 @@ class Orchestrator:
         """
         if not isinstance(payload, dict):
             return
-        
+
         try:
-            # Update config dict if it's a dict
-            if isinstance(self.config, dict):
-                # Apply mode
-                if "mode" in payload:
-                    mode = str(payload["mode"]).lower()
-                    if mode in ("tabletop", "inline"):
-                        self.config.setdefault("app", {})["mode"] = mode
-                        self.sm.set_mode(mode)
-                
-                # Apply control source
-                if "control_source" in payload:
-                    src = str(payload["control_source"]).lower()
-                    if src in ("local", "remote", "mixed"):
-                        self.config.setdefault("app", {})["control_source"] = src
-                        self.ui_set_control_source(src)
-                
-                # Apply remote enable
-                if "remote_enable" in payload:
-                    self.config.setdefault("protocols", {})["remote_enable"] = bool(payload["remote_enable"])
-                
-                # Apply comm loss action
-                if "comm_loss_action" in payload:
-                    action = str(payload["comm_loss_action"]).lower()
-                    if action in ("safe_stop", "hold_last", "pause"):
-                        self.config.setdefault("protocols", {})["comm_loss_action"] = action
-                        self.sm.set_comm_loss_action(action)
-                
-                # Apply inline auto resume
-                if "inline_auto_resume" in payload:
-                    self.config.setdefault("app", {})["inline_auto_resume"] = bool(payload["inline_auto_resume"])
-                
-                # Apply safety limits
-                if "max_current_ma" in payload:
-                    val = float(payload["max_current_ma"])
-                    if 1 <= val <= 500:
-                        self.config.setdefault("safety", {})["max_current_ma"] = val
-                        # Update safety manager if it has a method to update limits
-                        if hasattr(self.safety, "update_limits"):
-                            self.safety.update_limits(max_current_ma=val)
-                
-                if "max_temp_c" in payload:
-                    val = float(payload["max_temp_c"])
-                    if 1 <= val <= 200:
-                        self.config.setdefault("safety", {})["max_temp_c"] = val
-                        if hasattr(self.safety, "update_limits"):
-                            self.safety.update_limits(max_temp_c=val)
-                
-                # Apply DSP settings
-                if "target_freq_hz" in payload:
-                    val = float(payload["target_freq_hz"])
-                    if 1 <= val <= 1000:
-                        self.config.setdefault("dsp", {})["target_freq_hz"] = val
-                
-                if "sweep_span_hz" in payload:
-                    val = float(payload["sweep_span_hz"])
-                    if 0 < val <= 200:
-                        self.config.setdefault("dsp", {})["sweep_span_hz"] = val
-                
-                if "sweep_step_hz" in payload:
-                    val = float(payload["sweep_step_hz"])
-                    if 0 < val <= 10:
-                        self.config.setdefault("dsp", {})["sweep_step_hz"] = val
-                
-                if "lockin_tau_s" in payload:
-                    val = float(payload["lockin_tau_s"])
-                    if 0 < val <= 10:
-                        self.config.setdefault("dsp", {})["lockin_tau_s"] = val
-            
-            # Also try ConfigManager set method if available
-            if hasattr(self.config, "set") and callable(getattr(self.config, "set", None)):
-                for key, value in payload.items():
-                    try:
-                        if key in ("mode", "control_source", "inline_auto_resume"):
-                            self.config.set(f"app.{key}", value)  # type: ignore
-                        elif key == "remote_enable":
-                            self.config.set("protocols.remote_enable", value)  # type: ignore
-                        elif key == "comm_loss_action":
-                            self.config.set("protocols.comm_loss_action", value)  # type: ignore
-                        elif key == "max_current_ma":
-                            self.config.set("safety.max_current_ma", value)  # type: ignore
-                        elif key == "max_temp_c":
-                            self.config.set("safety.max_temp_c", value)  # type: ignore
-                        elif key in ("target_freq_hz", "sweep_span_hz", "sweep_step_hz", "lockin_tau_s"):
-                            self.config.set(f"dsp.{key}", value)  # type: ignore
-                    except Exception:
-                        pass
-            
+            for key, raw in payload.items():
+                handler = _SETTINGS_HANDLERS.get(key)
+                if handler is None:
+                    continue
+                path, coerce, valid, hook = handler
+                try:
+                    value = coerce(raw)
+                except (TypeError, ValueError):
+                    self.logger.warning("Ignoring setting %s=%r: bad value", key, raw)
+                    continue
+                if not valid(value):
+                    self.logger.warning("Ignoring setting %s=%r: out of range", key, raw)
+                    continue
+                self._cfg_set(path, value)
+                if hook is not None:
+                    getattr(self, hook)(key, value)
+
+            self.bump_cfg()
+            self.refresh_log_level()
             self.logger.info("Settings updated from Engineer Screen")
         except Exception as e:
             self.logger.error(f"Failed to apply settings update: {e}")
 
+    # Side effects for _SETTINGS_HANDLERS (config is already written)
+    def _on_mode_setting(self, _key: str, mode: str) -> None:
+        self.sm.set_mode(mode)
+
+    def _on_comm_loss_setting(self, _key: str, action: str) -> None:
+        self.sm.set_comm_loss_action(action)
+
+    def _on_safety_limit_setting(self, key: str, val: float) -> None:
+        if hasattr(self.safety, "update_limits"):
+            self.safety.update_limits(**{key: val})
+
     def _apply_auto_resume_policy(self) -> None:
         mode = str(self._cfg_get("app.mode", "tabletop"))
         if mode != "inline":
@@ -608,37 +884,84 @@ class Orchestrator:
 
     def _load_runtime_state(self) -> Dict[str, Any]:
         if not os.path.exists(self._runtime_state_path):
+            return self._migrate_legacy_runtime_state()
+        try:
+            with open(self._runtime_state_path, "rb") as f:
+                data = f.read(_RUNTIME_STATE.size + 1)
+            running, ts = _RUNTIME_STATE.unpack(data)
+        except (OSError, struct.error):
+            # Truncated/oversized file: read it as "was not running"
+            return {}
+        if data[0] > 1 or not math.isfinite(ts):
+            return {}  # not a record _write_runtime_state produced
+        return {"running": running, "ts": ts}
+
+    def _migrate_legacy_runtime_state(self) -> Dict[str, Any]:
+        # One-time upgrade from the old runtime_state.json
+        legacy = self._legacy_runtime_state_path
+        if not os.path.exists(legacy):
             return {}
-        with open(self._runtime_state_path, "r", encoding="utf-8") as f:
-            return json.load(f)
+        with open(legacy, "r", encoding="utf-8") as f:
+            st = json.load(f)
+        try:
+            self._write_runtime_state(bool(st.get("running", False)), float(st.get("ts", 0.0)))
+            os.replace(legacy, legacy + ".migrated")
+        except Exception:
+            pass
+        return st
 
     def _persist_runtime_state(self, running: bool) -> None:
+        # Called every tick; only touch the disk when the flag changes
+        running = bool(running)
+        if running is self._last_persisted_running:
+            return
         try:
-            payload = {"running": bool(running), "ts": time.time()}
-            with open(self._runtime_state_path, "w", encoding="utf-8") as f:
-                json.dump(payload, f)
+            self._write_runtime_state(running, time.time())
+            self._last_persisted_running = running
         except Exception:
             pass
 
+    def _write_runtime_state(self, running: bool, ts: float) -> None:
+        tmp_path = self._runtime_state_path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(_RUNTIME_STATE.pack(running, ts))
+        # Atomic swap: a crash mid-write never leaves a torn file behind
+        os.replace(tmp_path, self._runtime_state_path)
+
     def _run_loop(self) -> None:
         self.logger.info("Orchestrator thread running")
 
-        tick_hz = float(self._cfg_get("app.sample_rate_hz", 200))
-        tick_hz = max(10.0, min(2000.0, tick_hz))
-        dt = 1.0 / tick_hz
+        dt = self._tick_dt
 
         self._persist_runtime_state(running=(self.sm.state != SystemState.IDLE))
 
-        next_t = time.perf_counter()
+        stop_wait = self._stop.wait
+        mono_ns = time.monotonic_ns
+        dt_ns = int(dt * 1e9)
+        max_lag_ns = 5 * dt_ns
+        next_ns = mono_ns()
+        anchor_ns = next_ns + _EPOCH_REANCHOR_NS
         while not self._stop.is_set():
-            now = time.perf_counter()
-            if now < next_t:
-                time.sleep(max(0.0, next_t - now))
+            now_ns = mono_ns()
+            if now_ns < next_ns:
+                # Sleeps until the deadline but returns at once on stop()
+                if stop_wait((next_ns - now_ns) * 1e-9):
+                    break
                 continue
-            next_t += dt
+            next_ns += dt_ns
+            if now_ns - next_ns > max_lag_ns:
+                # Fell far behind (slow tick / host stall): resync instead of
+                # bursting through the backlog
+                if self._log_debug_enabled:
+                    self.logger.debug("Tick skew %.1f ms, resyncing schedule", (now_ns - next_ns) * 1e-6)
+                next_ns = now_ns
+            if now_ns >= anchor_ns:
+                # Pick up wall-clock steps (NTP sync after boot on the Pi)
+                self._anchor_epoch()
+                anchor_ns = now_ns + _EPOCH_REANCHOR_NS
 
             try:
-                self._tick(dt)
+                self._tick(dt, now_ns)
             except Exception as e:
                 self.logger.error("Tick error: %s", e, exc_info=True)
                 try:
@@ -646,19 +969,46 @@ class Orchestrator:
                 except Exception:
                     pass
 
-    def _tick(self, dt: float) -> None:
-        ts = time.time()
-
-        mode = str(self._cfg_get("app.mode", "tabletop"))
-        control_source = str(self._cfg_get("app.control_source", "mixed"))
-        remote_enabled = bool(self._cfg_get("protocols.remote_enable", True))
-
-        # 1) Read remote PLC commands (Modbus)
-        if remote_enabled and control_source in ("remote", "mixed"):
-            self._poll_modbus_commands()
-
-        # 2) Read temperature
-        temp_c, temp_fault = self._read_temperature()
+    def _anchor_epoch(self) -> None:
+        # Wall time = _epoch_ns + monotonic_ns(); one clock read per tick
+        self._epoch_ns = time.time_ns() - time.monotonic_ns()
+
+    def _tick(self, dt: float, now_ns: Optional[int] = None) -> None:
+        if now_ns is None:
+            now_ns = time.monotonic_ns()
+        ts = (self._epoch_ns + now_ns) * 1e-9
+
+        if self._cfg_cache_ver != self._cfg_version:
+            self._cfg_cache_ver = self._cfg_version
+            self._refresh_hot_config()
+
+        mode = self._mode
+        control_source = self._control_source
+        remote_enabled = self._remote_enabled
+
+        # 1) Read remote PLC commands (Modbus); None unless remote control is active
+        remote_poll = self._remote_poll
+        if remote_poll is not None:
+            remote_poll()
+
+        # 2) Read temperature: latest poller sample once started, direct read
+        # only when ticked without start() (no poller thread to race with)
+        latest = self._temp_latest
+        temp_stale = False
+        if latest is None:
+            temp_c, temp_fault = self._read_temperature()
+        else:
+            temp_c, temp_fault, temp_ns = latest
+            if now_ns - temp_ns > self._temp_stale_ns:
+                temp_stale = temp_fault = True
+                if not self._temp_stale_logged:
+                    self._temp_stale_logged = True
+                    self.logger.warning(
+                        "Temperature sample stale (%.1f s old); treating as fault",
+                        (now_ns - temp_ns) * 1e-9,
+                    )
+            elif self._temp_stale_logged:
+                self._temp_stale_logged = False
 
         # 3) Read ADC (pickup)
         adc_val = self._read_adc()
@@ -693,7 +1043,7 @@ class Orchestrator:
         fault = bool(temp_fault) or bool(self._infer_fault())
 
         # 6) Safety check (best-effort)
-        fault_reason = ""
+        fault_reason = "temp_sample_stale" if temp_stale else ""
         try:
             ok, reason = self._check_safety(temp_c=temp_c, duty=duty)
             if not ok:
@@ -713,31 +1063,33 @@ class Orchestrator:
             pass
 
         # 7) Compute confidence / viscosity
-        confidence = float(self._compute_confidence(mag=mag, phase_deg=ph, adc_val=adc_val, locked=locked))
-        viscosity_cp = float(self._compute_viscosity(mag=mag, temp_c=temp_c))
+        confidence = self._compute_confidence(mag=mag, phase_deg=ph, adc_val=adc_val, locked=locked)
+        viscosity_cp = self._compute_viscosity(mag=mag, temp_c=temp_c)
 
-        # 8) Diagnostics update
+        # 8) Diagnostics update (one sample object, overwritten each tick)
         try:
-            self.diag.update(
-                {
-                    "ts": ts,
-                    "state": str(self.sm.state.name),
-                    "mode": mode,
-                    "freq_hz": freq_hz,
-                    "duty": duty,
-                    "adc_raw": adc_val,
-                    "magnitude": mag,
-                    "phase_deg": ph,
-                    "viscosity_cp": viscosity_cp,
-                    "temp_c": temp_c,
-                    "confidence": confidence,
-                    "locked": locked,
-                    "fault": fault,
-                }
-            )
+            d = self._diag_sample
+            d.ts = ts
+            d.state = self.sm.state.name
+            d.mode = mode
+            d.freq_hz = freq_hz
+            d.duty = duty
+            d.adc_raw = adc_val
+            d.magnitude = mag
+            d.phase_deg = ph
+            d.viscosity_cp = viscosity_cp
+            d.temp_c = temp_c
+            d.confidence = confidence
+            d.locked = locked
+            d.fault = fault
+            self.diag.update(d)
         except Exception:
             pass
 
+        # State is settled for the rest of the tick
+        state = self.sm.state
+        running = state in _RUNNING_STATES
+
         # 9) Publish to Modbus registers
         try:
             self._publish_modbus(
@@ -749,6 +1101,7 @@ class Orchestrator:
                 locked=locked,
                 fault=fault,
                 remote_enabled=remote_enabled,
+                running=running,
             )
         except Exception:
             pass
@@ -757,30 +1110,31 @@ class Orchestrator:
         self._log(ts, mode, viscosity_cp, temp_c, freq_hz, duty, mag, ph, confidence, locked, fault)
 
         # 11) Snapshot for UI
-        with self._snapshot_lock:
-            self._snapshot = RuntimeSnapshot(
-                ts=ts,
-                state=str(self.sm.state.name),
-                mode=mode,
-                control_source=control_source,
-                freq_hz=float(freq_hz),
-                duty=float(duty),
-                adc_raw=float(adc_val),
-                magnitude=float(mag),
-                phase_deg=float(ph),
-                viscosity_cp=float(viscosity_cp),
-                temp_c=float(temp_c),
-                confidence=float(confidence),
-                health_ok=bool(confidence >= float(self._cfg_get("health.min_confidence_ok", 60.0))),
-                locked=bool(locked),
-                fault=bool(self.sm.state == SystemState.FAULT or fault),
-                alarm_active=bool(self.sm.state == SystemState.FAULT),
-                alarms=self.safety.alarms() if hasattr(self.safety, "alarms") else {},
-                last_fault_reason=str(fault_reason),
-                remote_enabled=bool(remote_enabled),
-                last_cmd_source=str(self._last_cmd_source),
-                active_profile=str(self._cfg_get("calibration.active_profile", "Default")),
-            )
+        state_faulted = state is SystemState.FAULT
+        snapshot = self._snapshot_scratch
+        snapshot.ts = ts
+        snapshot.state = state.name
+        snapshot.mode = mode
+        snapshot.control_source = control_source
+        snapshot.freq_hz = float(freq_hz)
+        snapshot.duty = float(duty)
+        snapshot.adc_raw = float(adc_val)
+        snapshot.magnitude = float(mag)
+        snapshot.phase_deg = float(ph)
+        snapshot.viscosity_cp = float(viscosity_cp)
+        snapshot.temp_c = float(temp_c)
+        snapshot.confidence = float(confidence)
+        snapshot.health_ok = confidence >= self._min_confidence_ok
+        snapshot.locked = bool(locked)
+        snapshot.fault = state_faulted or bool(fault)
+        snapshot.alarm_active = state_faulted
+        snapshot.alarms = self._safety_alarms() if self._safety_alarms is not None else {}
+        snapshot.last_fault_reason = str(fault_reason)
+        snapshot.remote_enabled = bool(remote_enabled)
+        snapshot.last_cmd_source = str(self._last_cmd_source)
+        snapshot.active_profile = self._active_profile
+        self._snapshot, self._snapshot_scratch = snapshot, self._snapshot
+        self._snapshot_seq += 1
         # print(
         # "[DEBUG FAULT]",
         # "state=", self._snapshot.state,
@@ -789,34 +1143,55 @@ class Orchestrator:
         # "duty=", self._snapshot.duty,
         # "reason=", self._snapshot.last_fault_reason)
 
-        # Publish frame on bus (best-effort)
+        # Publish frame on bus (best-effort). The bus hands this dict to
+        # subscribers by reference, so it is a fresh one each tick.
+        # Frames whose values match the last published one at the precision
+        # the screens show them (engineer diagnostics, calibration feature)
+        # are skipped, with a _FRAME_HEARTBEAT_S republish so readers see it live.
         try:
-            snap = asdict(self._snapshot)
-            snap["confidence_pct"] = int(confidence)
-            snap["health_score"] = int(100 if snap.get("health_ok") else confidence)
-            snap["running"] = self.sm.state in (SystemState.SWEEPING, SystemState.LOCKING, SystemState.RUNNING)
-            snap["fault_latched"] = self.safety.fault_latched() if hasattr(self.safety, "fault_latched") else False
-            snap["alarm_acknowledged"] = self.safety.is_acknowledged() if hasattr(self.safety, "is_acknowledged") else False
-            snap["logging"] = self.csv.is_enabled() if hasattr(self.csv, "is_enabled") else False
-
-            # print("[DEBUG ORCH FRAME]",
-            #     "temp=", snap.get("temp_c"),
-            #     "visc=", snap.get("viscosity_cp"),
-            #     "freq=", snap.get("freq_hz"))
-
-
-            # Try specific method first
-            if hasattr(self.bus, "publish_frame"):
-                self.bus.publish_frame(snap)
-            # Fallback to general publish
-            elif hasattr(self.bus, "publish"):
-                self.bus.publish("frame", snap)
-                self.bus.publish("ui.frame", snap)
+            fault_latched = self._safety_fault_latched() if self._safety_fault_latched is not None else False
+            alarm_ack = self._safety_is_ack() if self._safety_is_ack is not None else False
+            logging_on = self._csv_is_enabled() if self._csv_is_enabled is not None else False
+            fp = (
+                state, mode, control_source, self._active_profile, self._last_cmd_source,
+                round(viscosity_cp, 2), round(temp_c, 2), round(freq_hz, 1), round(duty, 3),
+                round(mag, 6), round(ph, 1), round(adc_val, 3), int(confidence),
+                snapshot.health_ok, locked, fault, fault_reason, remote_enabled, snapshot.alarms,
+                fault_latched, alarm_ack, logging_on,
+            )
+            if fp != self._frame_fp or ts - self._frame_pub_ts >= _FRAME_HEARTBEAT_S:
+                self._frame_fp = fp
+                self._frame_pub_ts = ts
+
+                snap = snapshot.to_dict()
+                snap["confidence_pct"] = int(confidence)
+                snap["health_score"] = int(100 if snap.get("health_ok") else confidence)
+                snap["running"] = running
+                snap["fault_latched"] = fault_latched
+                snap["alarm_acknowledged"] = alarm_ack
+                snap["logging"] = logging_on
+
+                # print("[DEBUG ORCH FRAME]",
+                #     "temp=", snap.get("temp_c"),
+                #     "visc=", snap.get("viscosity_cp"),
+                #     "freq=", snap.get("freq_hz"))
+
+
+                # Try specific method first
+                if self._bus_publish_frame is not None:
+                    self._bus_publish_frame(snap)
+                # Fallback to general publish
+                elif hasattr(self.bus, "publish"):
+                    self.bus.publish("frame", snap)
+                    self.bus.publish("ui.frame", snap)
         except Exception:
             pass
 
-        # Persist running state for auto-resume
-        self._persist_runtime_state(running=(self.sm.state != SystemState.IDLE))
+        # Persist running state for auto-resume (written by the log writer)
+        running = self.sm.state != SystemState.IDLE
+        if running is not self._runtime_running:
+            self._runtime_running = running
+            self._log_wake.set()
 
         # Retention maintenance occasionally
         self._maybe_run_retention(ts)
@@ -825,56 +1200,64 @@ class Orchestrator:
     # Low-level helpers
     # ------------------------
     def _poll_modbus_commands(self) -> None:
-        addr = self.regmap.layout().get("CONTROL_WORD", None)
+        addr = self._mb_control_word_addr
         if addr is None: return
 
         cw = None
         try:
-            if hasattr(self.modbus, "get_holding_register"):
-                cw = int(self.modbus.get_holding_register(addr))
-            elif hasattr(self.modbus, "read_holding_register"):
-                cw = int(self.modbus.read_holding_register(addr))
+            if self._modbus_get_hr is not None:
+                cw = int(self._modbus_get_hr(addr))
         except Exception:
             cw = None
 
         if cw is None: return
 
-        decoded = self.regmap.decode_control_word(int(cw))
-        prev = int(self._last_control_word)
-        prev_dec = self.regmap.decode_control_word(prev)
-
-        edge_start = bool(decoded.get("start")) and not bool(prev_dec.get("start"))
-        edge_stop = bool(decoded.get("stop")) and not bool(prev_dec.get("stop"))
-        edge_ack = bool(decoded.get("ack")) and not bool(prev_dec.get("ack"))
-        edge_reset = bool(decoded.get("reset")) and not bool(prev_dec.get("reset"))
+        prev = self._last_control_word
+        cw &= _CW_COMMANDS
+        # No command bit set: nothing can fire, just clear the edge history
+        if not cw:
+            self._last_control_word = 0
+            return
 
-        remote_start_edge = bool(self._cfg_get("plc.remote_start_edge", True))
-        remote_stop_edge = bool(self._cfg_get("plc.remote_stop_edge", True))
+        # Rising edges in one AND; start/stop may also act while held
+        # (level mode), ack/reset always do
+        rising = cw & ~prev
+        start_ok = rising if self._remote_start_edge else cw
+        stop_ok = rising if self._remote_stop_edge else cw
 
-        if decoded.get("start") and (edge_start or not remote_start_edge):
+        if start_ok & _CW_START:
             self._last_cmd_source = "remote"
             self.sm.handle_event("START", {"source": "remote"})
-        if decoded.get("stop") and (edge_stop or not remote_stop_edge):
+        if stop_ok & _CW_STOP:
             self._last_cmd_source = "remote"
             self.sm.handle_event("STOP", {"source": "remote"})
-        if decoded.get("ack") and (edge_ack or True):
+        if cw & _CW_ACK:
             self._last_cmd_source = "remote"
             self.sm.handle_event("ALARM_ACK", {"source": "remote"})
-        if decoded.get("reset") and (edge_reset or True):
+        if cw & _CW_RESET:
             self._last_cmd_source = "remote"
             self.sm.handle_event("ALARM_RESET", {"source": "remote"})
 
-        self._last_control_word = int(cw)
+        self._last_control_word = cw
+
+    def _temp_poll_loop(self) -> None:
+        stop_wait = self._stop.wait
+        mono_ns = time.monotonic_ns
+        while True:
+            temp_c, fault = self._read_temperature()
+            self._temp_latest = (temp_c, fault, mono_ns())
+            if stop_wait(self._temp_poll_s):
+                break
 
     def _read_temperature(self) -> Tuple[float, bool]:
         temp_c = 0.0
         fault = False
         try:
-            if hasattr(self.temp, "read_temp_c"):
-                temp_c = float(self.temp.read_temp_c())
-            elif hasattr(self.temp, "read"):
+            if self._temp_read_c is not None:
+                temp_c = float(self._temp_read_c())
+            elif self._temp_read is not None:
                 # fallback for older driver interface
-                out = self.temp.read()
+                out = self._temp_read()
                 if isinstance(out, dict):
                     temp_c = float(out.get("temp_c", 0.0))
                     fault = bool(out.get("fault", False))
@@ -895,17 +1278,14 @@ class Orchestrator:
     #     return 0.0
     def _read_adc(self) -> float:
         try:
-            if hasattr(self.adc, "read_sample_volts"):
-                return float(self.adc.read_sample_volts())
-            if hasattr(self.adc, "read"):
-                return float(self.adc.read())
+            if self._adc_read is not None:
+                return float(self._adc_read())
         except Exception:
             pass
         
         # Fallback/Mock: random noise if driver fails (for desktop testing)
-        if os.environ.get("MOCK_MODE", "1") == "1":
-            import random
-            return 0.5 + random.uniform(-0.01, 0.01)
+        if self._mock_mode:
+            return 0.5 + self._rand(-0.01, 0.01)
             
         return 0.0
 
@@ -913,50 +1293,50 @@ class Orchestrator:
         # Default: fixed freq, duty per state
         freq = float(getattr(self.lockin, "ref_freq_hz", self._target_freq_hz))
 
+        state = self.sm.state
+
         # If sweeping, set freq from sweep tracker
-        if self.sm.state == SystemState.SWEEPING:
+        if state is SystemState.SWEEPING:
             try:
-                if hasattr(self.sweep, "get_current_freq"):
-                    freq = float(self.sweep.get_current_freq())
+                if self._sweep_current_freq is not None:
+                    freq = float(self._sweep_current_freq())
                 elif hasattr(self.sweep, "current_freq"):
                     freq = float(self.sweep.current_freq)
             except Exception:
                 pass
 
         # Duty policy
-        start_duty = float(self._cfg_get("drivers.drive_pwm.start_duty", 0.15))
+        start_duty = self._start_duty
         duty = start_duty
 
-        if self.sm.state in (SystemState.IDLE, SystemState.STOPPING, SystemState.FAULT):
+        if state in _DUTY_ZERO_STATES:
             duty = 0.0
-        elif self.sm.state in (SystemState.SWEEPING, SystemState.LOCKING, SystemState.RUNNING):
-            duty = float(self.drive.get_duty() if hasattr(self.drive, "get_duty") else start_duty)
+        elif state in _RUNNING_STATES:
+            duty = float(self._drive_get_duty() if self._drive_get_duty is not None else start_duty)
 
         # Clamp by safety max drive duty
-        max_drive = float(self._cfg_get("safety.max_drive_duty", 0.85))
+        max_drive = self._max_drive_duty
         duty = max(0.0, min(float(duty), float(max_drive)))
 
         return freq, duty
 
     def _apply_drive(self, freq_hz: float, duty: float) -> None:
         try:
-            if hasattr(self.drive, "set_frequency"):
-                self.drive.set_frequency(float(freq_hz))
+            if self._drive_set_freq is not None:
+                self._drive_set_freq(float(freq_hz))
         except Exception:
             pass
 
         try:
-            if hasattr(self.drive, "set_duty"):
-                self.drive.set_duty(float(duty))
-            elif hasattr(self.drive, "set_amplitude"):
-                self.drive.set_amplitude(float(duty))
+            if self._drive_set_level is not None:
+                self._drive_set_level(float(duty))
         except Exception:
             pass
 
     def _infer_locked(self) -> bool:
         try:
-            if hasattr(self.sm, "is_locked"):
-                return bool(self.sm.is_locked())
+            if self._sm_is_locked is not None:
+                return bool(self._sm_is_locked())
         except Exception:
             pass
         return self.sm.state == SystemState.RUNNING
@@ -966,10 +1346,10 @@ class Orchestrator:
 
     def _check_safety(self, temp_c: float, duty: float) -> Tuple[bool, str]:
         try:
-            if hasattr(self.safety, "evaluate"):
+            if self._safety_eval is not None:
                 # SafetyManager.evaluate returns SafetyDecision.
                 # We pass 0 for requested current as we use duty cycle control here.
-                decision = self.safety.evaluate(
+                decision = self._safety_eval(
                     requested_current_ma=0,
                     temp_c=temp_c,
                     adc_ok=True,
@@ -980,15 +1360,15 @@ class Orchestrator:
             pass
 
         # Minimal local checks
-        if temp_c >= float(self._cfg_get("safety.max_temp_c", 80.0)):
+        if temp_c >= self._max_temp_c:
             return False, "overtemp"
-        if duty > float(self._cfg_get("safety.max_drive_duty", 0.85)):
+        if duty > self._max_drive_duty:
             return False, "overduty"
         return True, ""
 
     def _compute_confidence(self, mag: float, phase_deg: float, adc_val: float, locked: bool) -> float:
         try:
-            if hasattr(self.health, "compute"):
+            if self._health_compute is not None:
                 # Prepare inputs for HealthScorer
                 frame_input = {
                     "confidence_pct": int(100 if mag > 0.001 else 0),
@@ -999,7 +1379,7 @@ class Orchestrator:
                     "alarms": {}
                 }
                 
-                result = self.health.compute(frame_input)
+                result = self._health_compute(frame_input)
                 if hasattr(result, "score"):
                     return float(result.score)
                 elif isinstance(result, (int, float)):
@@ -1009,38 +1389,25 @@ class Orchestrator:
             pass
 
         # fallback simple score
-        base = 80.0 if locked else 40.0
-        if mag <= 0.0001:
-            base -= 30.0
-        return max(0.0, min(100.0, base))
-
-    def _compute_viscosity(self, mag: float, temp_c: float) -> float:
-        # --- DEV MOCK: show fake viscosity for UI sanity ---
-        try:
-            # DEV MOCK: Default to enabled ("1") for desktop testing if no sensors
-            if os.environ.get("MOCK_MODE", "1") == "1":
-                # Generate fake viscosity based on mag (assuming mag is simulated)
-                # If mag is 0 (no ADC), generate a sine wave for visual feedback
-                if mag < 0.0001:
-                    return float(abs(math.sin(time.time()) * 100.0) + 50.0)
-                return max(0.0, 1000.0 * mag)
-        except Exception:
-            pass
+        return _fallback_confidence(mag, locked)
 
+    def _compute_viscosity_mock(self, mag: float, temp_c: float) -> float:
+        return float(_mock_viscosity(mag, time.time()))
 
-        mode = str(self._cfg_get("app.mode", "tabletop"))
-        profile_name = str(self._cfg_get("calibration.active_profile", "Default"))
+    def _compute_viscosity_real(self, mag: float, temp_c: float) -> float:
+        mode = self._mode
+        profile_name = self._active_profile
 
         profile_id = None
         try:
-            if hasattr(self.cal_store, "get_active_set_id"):
-                profile_id = self.cal_store.get_active_set_id(mode, profile_name)
+            if self._cal_active_set_id is not None:
+                profile_id = self._cal_active_set_id(mode, profile_name)
         except Exception:
             pass
 
         try:
-            if hasattr(self.visc_compute, "compute"):
-                res = self.visc_compute.compute(
+            if self._visc_compute is not None:
+                res = self._visc_compute(
                     feature_or_frame=float(mag),
                     temp_c=float(temp_c),
                     profile_id=profile_id,
@@ -1063,40 +1430,40 @@ class Orchestrator:
         locked: bool,
         fault: bool,
         remote_enabled: bool,
+        running: bool,
     ) -> None:
-        layout = self.regmap.layout()
-
-        status_word = self.regmap.encode_status_word(
-            {
-                "running": self.sm.state in (SystemState.SWEEPING, SystemState.LOCKING, SystemState.RUNNING),
-                "locked": bool(locked),
-                "fault": bool(fault),
-                "alarm_active": bool(fault),
-                "remote_enabled": bool(remote_enabled),
-            }
-        )
+        status_word = _SW_READY
+        if running:
+            status_word |= _SW_RUNNING
+        if locked:
+            status_word |= _SW_LOCKED
+        if fault:
+            status_word |= _SW_FAULT
+        if remote_enabled:
+            status_word |= _SW_REMOTE
+
+        if self._mb_live:
+            self._mb_status.pack_into(self._mb_status_buf, 0, status_word)
+            self._mb_f32_pack(
+                self._mb_f32_buf, 0,
+                viscosity_cp, temp_c, freq_hz, mag, confidence,
+            )
+            return
 
-        def wr(name: str, value: int) -> None:
-            addr = layout.get(name)
-            if addr is None: return
-            if hasattr(self.modbus, "set_holding_register"):
-                self.modbus.set_holding_register(addr, int(value))
-            elif hasattr(self.modbus, "write_holding_register"):
-                self.modbus.write_holding_register(addr, int(value))
-
-        def wr_f32(prefix: str, val: float) -> None:
-            hi_name = f"{prefix}_F32_HI"
-            lo_name = f"{prefix}_F32_LO"
-            hi, lo = self.regmap.f32_to_u16pair(float(val))
-            wr(hi_name, hi)
-            wr(lo_name, lo)
-
-        wr("STATUS_WORD", int(status_word))
-        wr_f32("VISCOSITY", float(viscosity_cp))
-        wr_f32("TEMP_C", float(temp_c))
-        wr_f32("FREQ_HZ", float(freq_hz))
-        wr_f32("MAG", float(mag))
-        wr_f32("CONFIDENCE", float(confidence))
+        # Adapter without live blocks: same values, written as one request
+        # per contiguous register run (STATUS_WORD; the 50-59 float block)
+        self._mb_f32_pack(self._mb_f32_buf, 0, viscosity_cp, temp_c, freq_hz, mag, confidence)
+        regs = (status_word,) + self._mb_u16_unpack(self._mb_f32_buf)
+
+        write_many = self._mb_write_many
+        write_one = self._mb_write_one
+        for base, idx in self._mb_publish_runs:
+            words = [regs[i] for i in idx]
+            if write_many is not None:
+                write_many(base, words)
+            elif write_one is not None:
+                for i, w in enumerate(words):
+                    write_one(base + i, w)
 
     def _log(
         self,
@@ -1112,77 +1479,129 @@ class Orchestrator:
         locked: bool,
         fault: bool,
     ) -> None:
-        # Build status word from state
-        status_word = 0
-        if self.sm.state in (SystemState.SWEEPING, SystemState.LOCKING, SystemState.RUNNING):
-            status_word |= (1 << 2)  # STATUS_SWEEPING
-        if locked:
-            status_word |= (1 << 4)  # STATUS_LOCKED
-        if fault or self.sm.state == SystemState.FAULT:
-            status_word |= (1 << 6)  # STATUS_FAULT_LATCHED
-        if self.sm.state == SystemState.PAUSED:
-            status_word |= (1 << 5)  # STATUS_PAUSED
-        
-        # Build alarm word from fault state
-        alarm_word = 0
-        if fault:
-            alarm_word |= (1 << 5)  # ALARM_LOST_LOCK (or other appropriate alarm)
-        
-        # Convert timestamp to milliseconds
-        timestamp_ms = int(ts * 1000)
-        
-        # Build frame for CSV logger (matches expected format)
-        frame = {
-            "timestamp_ms": timestamp_ms,
-            "viscosity_cp": float(viscosity_cp),
-            "temp_c": float(temp_c),
-            "freq_hz": float(freq_hz),
-            "health_pct": int(confidence),
-            "status_word": status_word,
-            "alarm_word": alarm_word,
-            # Extra fields stored in extra_json
-            "mode": mode,
-            "state": str(self.sm.state.name),
-            "duty": float(duty),
-            "magnitude": float(mag),
-            "phase_deg": float(ph),
-            "confidence": float(confidence),
-            "locked": int(bool(locked)),
-            "fault": int(bool(fault)),
-        }
+        # Tick side: one lock-free append; frames are built and written by
+        # the log writer thread
+        q = self._log_q
+        if len(q) == _LOG_QUEUE_MAX:
+            self._log_dropped += 1
+        q.append((ts, mode, self.sm.state, viscosity_cp, temp_c, freq_hz, duty, mag, ph, confidence, locked, fault))
+        if len(q) >= _LOG_HIGH_WATER and not self._log_wake.is_set():
+            self._log_wake.set()
+
+    def _log_writer_loop(self) -> None:
+        wake = self._log_wake
+        while not self._stop.is_set():
+            wake.wait(self._log_flush_s)
+            wake.clear()
+            self._drain_log_queue()
+            self._run_deferred_io()
+
+    def _run_deferred_io(self) -> None:
+        # Log writer thread: file I/O requested by the tick
+        running = self._runtime_running
+        if running is not None:
+            self._persist_runtime_state(running)
+        if self._ret_due:
+            self._ret_due = False
+            self._run_retention()
+
+    def _drain_log_queue(self) -> None:
+        q = self._log_q
+        while q:
+            pop = q.popleft
+            items = []
+            try:
+                for _ in range(_LOG_BATCH_MAX):
+                    items.append(pop())
+            except IndexError:
+                pass
+            if items:
+                self._write_log_batch(items)
 
+        total = self._log_dropped
+        if total != self._log_dropped_reported:
+            dropped, self._log_dropped_reported = total - self._log_dropped_reported, total
+            self.logger.warning("Log writer fell behind; %d samples dropped", dropped)
+
+    def _write_log_batch(self, items: List[Tuple[Any, ...]]) -> None:
         # CSV logging
         try:
-            if bool(self._cfg_get("storage.csv_logger.enabled", True)):
-                if hasattr(self.csv, "log_frame"):
-                    self.csv.log_frame(frame)
+            if self._csv_enabled:
+                if hasattr(self.csv, "log_frames"):
+                    self.csv.log_frames(self._iter_log_frames(items))
+                elif hasattr(self.csv, "log_frame"):
+                    for frame in self._iter_log_frames(items):
+                        self.csv.log_frame(frame)
         except Exception:
-            pass
+            self.logger.warning("CSV batch write failed (%d rows)", len(items), exc_info=True)
 
-        # SQLite event logging (optional - log as event)
+        # SQLite event logging (optional - log as event), one transaction per batch
+        if not self._sqlite_enabled:
+            return
+        rows = []
+        for ts, mode, state, viscosity_cp, temp_c, freq_hz, *_ in items:
+            ts_ms = int(ts * 1000)
+            rows.append((ts_ms, "measurement", {
+                "timestamp_ms": ts_ms,
+                "viscosity_cp": float(viscosity_cp),
+                "temp_c": float(temp_c),
+                "freq_hz": float(freq_hz),
+                "mode": mode,
+                "state": _STATE_NAME[state],
+            }))
         try:
-            if bool(self._cfg_get("storage.sqlite.enabled", True)):
-                if hasattr(self.sqlite, "log_event"):
-                    # Log measurement as event (optional, to avoid too many events)
-                    # Only log significant state changes or periodic samples
-                    self.sqlite.log_event("measurement", {
-                        "timestamp_ms": timestamp_ms,
-                        "viscosity_cp": viscosity_cp,
-                        "temp_c": temp_c,
-                        "freq_hz": freq_hz,
-                        "mode": mode,
-                        "state": str(self.sm.state.name),
-                    })
+            if hasattr(self.sqlite, "log_events"):
+                self.sqlite.log_events(rows)
+            elif hasattr(self.sqlite, "log_event"):
+                for ts_ms, event_type, details in rows:
+                    self.sqlite.log_event(event_type, details, ts_ms=ts_ms)
         except Exception:
-            pass
+            self.logger.warning("SQLite batch flush failed (%d rows dropped)", len(rows), exc_info=True)
+
+    def _iter_log_frames(self, items: List[Tuple[Any, ...]]) -> Any:
+        """
+        Yield one CSV frame per queued sample. The same dict is refilled for
+        every item, so consumers must be done with a frame before the next.
+        """
+        f = self._log_frame_buf
+        for (ts, mode, state, viscosity_cp, temp_c, freq_hz, duty,
+             mag, ph, confidence, locked, fault) in items:
+            locked = bool(locked)
+            fault = bool(fault)
+            f["timestamp_ms"] = int(ts * 1000)
+            f["viscosity_cp"] = float(viscosity_cp)
+            f["temp_c"] = float(temp_c)
+            f["freq_hz"] = float(freq_hz)
+            f["health_pct"] = int(confidence)
+            # Status word: state-derived bits from the table, plus live flags
+            f["status_word"] = (
+                _STATE_STATUS_BITS.get(state, 0)
+                | (locked << STATUS_LOCKED)
+                | (fault << STATUS_FAULT_LATCHED)
+            )
+            # Alarm word from fault state (ALARM_LOST_LOCK or other appropriate alarm)
+            f["alarm_word"] = fault << ALARM_LOST_LOCK
+            # Extra fields stored in extra_json
+            f["mode"] = mode
+            f["state"] = _STATE_NAME[state]
+            f["duty"] = float(duty)
+            f["magnitude"] = float(mag)
+            f["phase_deg"] = float(ph)
+            f["confidence"] = float(confidence)
+            f["locked"] = int(locked)
+            f["fault"] = int(fault)
+            yield f
 
     def _maybe_run_retention(self, ts: float) -> None:
+        # Tick side: only schedules; the folder scan runs on the log writer
+        if ts - self._ret_last_ts < 600.0:  # Run every 10 minutes
+            return
+        self._ret_last_ts = ts
+        self._ret_due = True
+        self._log_wake.set()
+
+    def _run_retention(self) -> None:
         try:
-            last = getattr(self, "_ret_last_ts", 0.0)
-            if ts - float(last) < 600.0:  # Run every 10 minutes
-                return
-            setattr(self, "_ret_last_ts", float(ts))
-            
             # Cleanup CSV files
             csv_dir = str(self._cfg_get("storage.csv_logger.folder", "logs"))
             if csv_dir and os.path.isdir(csv_dir):
@@ -21,8 +21,13 @@ ALM_ADC_FAULT = "ADC_FAULT"
 ALM_TEMP_FAULT = "TEMP_FAULT"
 ALM_SIGNAL_CLIP = "SIGNAL_CLIP"
 
+# SafetyDecision.reason values
+REASON_OK = "ok"
+REASON_FAULT_LATCHED = "fault_latched"
+REASON_CRITICAL_ALARM = "critical_alarm"
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class SafetyDecision:
     allow_drive: bool
     fault_latched: bool
@@ -53,6 +58,12 @@ class SafetyManager:
 
         self._fault_latched = False
         self._alarms: Dict[str, bool] = {}
+        # alarms() hands out a cached copy, rebuilt only after a change
+        self._alarms_version = 0
+        self._alarms_snapshot: Dict[str, bool] = {}
+        self._alarms_snapshot_ver = 0
+        self._decision: Optional[SafetyDecision] = None
+        self._decision_key: Optional[tuple] = None
         self._last_trip_ms = 0
 
         # Air calibration guard timer
@@ -66,14 +77,25 @@ class SafetyManager:
         return bool(self._fault_latched)
 
     def alarms(self) -> Dict[str, bool]:
-        return dict(self._alarms)
+        """
+        Current alarm flags. The returned dict is shared between callers
+        until the next alarm change: treat it as read-only.
+        """
+        if self._alarms_snapshot_ver != self._alarms_version:
+            self._alarms_snapshot = dict(self._alarms)
+            self._alarms_snapshot_ver = self._alarms_version
+        return self._alarms_snapshot
 
     def clear_alarm(self, key: str) -> None:
-        if key in self._alarms:
+        if self._alarms.get(key):
             self._alarms[key] = False
+            self._alarms_version += 1
 
     def set_alarm(self, key: str, value: bool = True) -> None:
-        self._alarms[key] = bool(value)
+        value = bool(value)
+        if self._alarms.get(key) is not value:
+            self._alarms[key] = value
+            self._alarms_version += 1
 
     def reset_alarms(self) -> bool:
         """
@@ -84,6 +106,7 @@ class SafetyManager:
         self._acknowledged = False  # Reset acknowledgment on reset
         for k in list(self._alarms.keys()):
             self._alarms[k] = False
+        self._alarms_version += 1
         return True
 
     def acknowledge_alarms(self) -> None:
@@ -180,7 +203,6 @@ class SafetyManager:
                 if float(measured_current_ma) > float(self.max_current_ma) * 1.05:
                     self.set_alarm(ALM_OVERCURRENT, True)
                     self._latch_fault("measured_overcurrent")
-                    self._latch_fault("measured_overcurrent")
             except Exception as e:
                 self.logger.warning("Error checking measured current: %s", e)
 
@@ -190,7 +212,6 @@ class SafetyManager:
                 if float(temp_c) >= float(self.temp_fault_c):
                     self.set_alarm(ALM_OVERHEAT, True)
                     self._latch_fault("overheat")
-                    self._latch_fault("overheat")
             except Exception as e:
                 self.logger.warning("Error checking temp: %s", e)
 
@@ -201,22 +222,27 @@ class SafetyManager:
 
         # Decide drive
         allow_drive = True
-        reason = "ok"
+        reason = REASON_OK
 
         if self._fault_latched:
             allow_drive = False
-            reason = "fault_latched"
+            reason = REASON_FAULT_LATCHED
         elif self._any_critical_alarm_active():
             # even without latch, if critical alarm active, block drive
             allow_drive = False
-            reason = "critical_alarm"
-
-        return SafetyDecision(
-            allow_drive=allow_drive,
-            fault_latched=self._fault_latched,
-            active_alarms=self.alarms(),
-            reason=reason,
-        )
+            reason = REASON_CRITICAL_ALARM
+
+        # Steady state (same outcome, no alarm change) reuses the last decision
+        key = (allow_drive, self._fault_latched, reason, self._alarms_version)
+        if key != self._decision_key:
+            self._decision = SafetyDecision(
+                allow_drive=allow_drive,
+                fault_latched=self._fault_latched,
+                active_alarms=self.alarms(),
+                reason=reason,
+            )
+            self._decision_key = key
+        return self._decision
 
     def _any_critical_alarm_active(self) -> bool:
         # Treat these as critical
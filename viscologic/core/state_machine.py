@@ -1,8 +1,9 @@
 # viscologic/core/state_machine.py
 from __future__ import annotations
+import sys
 from enum import Enum, auto
 from dataclasses import dataclass
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
 
 # 1. Define SystemState as an Enum (Required by Orchestrator)
 class SystemState(Enum):
@@ -19,20 +20,58 @@ class SystemState(Enum):
     STOPPING = auto()  # Added: Used in Orchestrator logic
 
 # 2. Define Event Constants (Internal use)
-EV_TICK = "TICK"
-EV_START = "START"
-EV_STOP = "STOP"
-EV_PAUSE = "PAUSE"
-EV_RESUME = "RESUME"
-EV_ABORT = "ABORT"
-EV_LOCK_ACQUIRED = "LOCK_ACQUIRED"
-EV_LOCK_LOST = "LOCK_LOST"
-EV_FAULT = "FAULT"
-EV_FAULT_CLEARED = "FAULT_CLEARED"
-EV_COMMISSIONING_REQUIRED = "COMMISSIONING_REQUIRED"
-EV_COMMISSIONING_DONE = "COMMISSIONING_DONE"
-EV_SELF_CHECK_OK = "SELF_CHECK_OK"
-EV_SELF_CHECK_FAIL = "SELF_CHECK_FAIL"
+# Interned: handle_event interns its argument and compares by identity
+EV_TICK = sys.intern("TICK")
+EV_START = sys.intern("START")
+EV_STOP = sys.intern("STOP")
+EV_PAUSE = sys.intern("PAUSE")
+EV_RESUME = sys.intern("RESUME")
+EV_ABORT = sys.intern("ABORT")
+EV_LOCK_ACQUIRED = sys.intern("LOCK_ACQUIRED")
+EV_LOCK_LOST = sys.intern("LOCK_LOST")
+EV_FAULT = sys.intern("FAULT")
+EV_FAULT_CLEARED = sys.intern("FAULT_CLEARED")
+EV_COMMISSIONING_REQUIRED = sys.intern("COMMISSIONING_REQUIRED")
+EV_COMMISSIONING_DONE = sys.intern("COMMISSIONING_DONE")
+EV_SELF_CHECK_OK = sys.intern("SELF_CHECK_OK")
+EV_SELF_CHECK_FAIL = sys.intern("SELF_CHECK_FAIL")
+# Sent by the Orchestrator
+EV_SWEEP_DONE = sys.intern("SWEEP_DONE")
+EV_LOCK_OK = sys.intern("LOCK_OK")
+EV_ALARM_RESET = sys.intern("ALARM_RESET")
+
+# (state, event) -> (new_state, reason). Events not listed for a state are
+# ignored; COMMISSIONING_REQUIRED and FAULT are handled before the lookup.
+_TRANSITIONS: Dict[Tuple[SystemState, str], Tuple[SystemState, str]] = {
+    # BOOT
+    (SystemState.BOOT, EV_TICK): (SystemState.SELF_CHECK, "boot_complete"),
+    # SELF_CHECK: auto-pass on tick for simulation; orchestrator may send a result event
+    (SystemState.SELF_CHECK, EV_TICK): (SystemState.IDLE, "self_check_pass"),
+    (SystemState.SELF_CHECK, EV_SELF_CHECK_FAIL): (SystemState.FAULT, "self_check_fail"),
+    # IDLE
+    (SystemState.IDLE, EV_START): (SystemState.SWEEPING, "start_command"),
+    # SWEEPING
+    (SystemState.SWEEPING, EV_STOP): (SystemState.IDLE, "stop_command"),
+    (SystemState.SWEEPING, EV_SWEEP_DONE): (SystemState.LOCKING, "sweep_done"),
+    (SystemState.SWEEPING, EV_LOCK_ACQUIRED): (SystemState.LOCKED, "direct_lock"),
+    # LOCKING
+    (SystemState.LOCKING, EV_STOP): (SystemState.IDLE, "stop_command"),
+    (SystemState.LOCKING, EV_LOCK_OK): (SystemState.RUNNING, "lock_acquired"),  # inferred from Orchestrator usage
+    # RUNNING
+    (SystemState.RUNNING, EV_STOP): (SystemState.IDLE, "stop_command"),
+    (SystemState.RUNNING, EV_LOCK_LOST): (SystemState.LOCKING, "lock_lost"),
+    # FAULT
+    (SystemState.FAULT, EV_ALARM_RESET): (SystemState.IDLE, "fault_reset"),  # or SELF_CHECK
+    (SystemState.FAULT, EV_FAULT_CLEARED): (SystemState.IDLE, "fault_reset"),
+    # COMMISSIONING
+    (SystemState.COMMISSIONING, EV_COMMISSIONING_DONE): (SystemState.IDLE, "commissioning_done"),
+    (SystemState.COMMISSIONING, EV_STOP): (SystemState.IDLE, "stop_command"),
+}
+
+# EV_TICK arrives every orchestrator loop; its transitions, keyed by state
+_TICK_TRANSITIONS: Dict[SystemState, Tuple[SystemState, str]] = {
+    st: nxt for (st, ev), nxt in _TRANSITIONS.items() if ev is EV_TICK
+}
 
 @dataclass
 class TransitionResult:
@@ -65,82 +104,46 @@ class SystemStateMachine:
 
     def tick(self, ctx: Dict[str, Any]) -> None:
         """Orchestrator calls this every loop iteration."""
-        # Map .tick() to the internal event handler
-        self.handle_event(EV_TICK, ctx)
+        # Same as handle_event(EV_TICK, ctx) without building a result
+        nxt = _TICK_TRANSITIONS.get(self.state)
+        if nxt is not None:
+            self._transition(*nxt)
 
     def handle_event(self, event: str, ctx: Optional[Dict[str, Any]] = None) -> TransitionResult:
         """
         Main transition logic (formerly on_event).
         Renamed to match Orchestrator call signature.
         """
-        ctx = ctx or {}
         prev = self.state
-        reason = ""
+        # Names built at runtime (UI/bus payloads) become the EV_* objects.
+        # intern() only takes exact str; subclasses compare equal as plain str.
+        if type(event) is not str:
+            if not isinstance(event, str):
+                return TransitionResult(prev, prev, False, "ignored")
+            event = str.__str__(event)
+        event = sys.intern(event)
+        if event is EV_TICK:
+            # Hot path: only BOOT and SELF_CHECK react to a tick
+            nxt = _TICK_TRANSITIONS.get(prev)
+            if nxt is None:
+                return TransitionResult(prev, prev, False, "ignored")
+            return self._transition(*nxt)
+
+        ctx = ctx or {}
 
         # --- Global Guards ---
-        if event == EV_COMMISSIONING_REQUIRED:
+        if event is EV_COMMISSIONING_REQUIRED:
             return self._transition(SystemState.COMMISSIONING, "commissioning_required")
             
-        if event == EV_FAULT:
+        if event is EV_FAULT:
             # Extract reason from context if available
             r = ctx.get("reason", "fault_triggered")
             return self._transition(SystemState.FAULT, r)
 
-        # --- State Logic ---
-        
-        # BOOT
-        if prev == SystemState.BOOT:
-            if event == EV_TICK:
-                return self._transition(SystemState.SELF_CHECK, "boot_complete")
-
-        # SELF_CHECK
-        elif prev == SystemState.SELF_CHECK:
-            # In real logic, orchestrator might drive this via tick or specific result events
-            # For now, auto-pass on tick for simulation if not implemented
-            if event == EV_TICK:
-                return self._transition(SystemState.IDLE, "self_check_pass") 
-            if event == EV_SELF_CHECK_FAIL:
-                 return self._transition(SystemState.FAULT, "self_check_fail")
-
-        # IDLE
-        elif prev == SystemState.IDLE:
-            if event == EV_START:
-                return self._transition(SystemState.SWEEPING, "start_command")
-
-        # SWEEPING
-        elif prev == SystemState.SWEEPING:
-            if event == EV_STOP:
-                return self._transition(SystemState.IDLE, "stop_command")
-            if event == "SWEEP_DONE":
-                return self._transition(SystemState.LOCKING, "sweep_done")
-            if event == EV_LOCK_ACQUIRED:
-                return self._transition(SystemState.LOCKED, "direct_lock")
-
-        # LOCKING
-        elif prev == SystemState.LOCKING:
-            if event == EV_STOP:
-                return self._transition(SystemState.IDLE, "stop_command")
-            if event == "LOCK_OK": # inferred from Orchestrator usage
-                return self._transition(SystemState.RUNNING, "lock_acquired")
-
-        # RUNNING
-        elif prev == SystemState.RUNNING:
-            if event == EV_STOP:
-                return self._transition(SystemState.IDLE, "stop_command")
-            if event == EV_LOCK_LOST:
-                return self._transition(SystemState.LOCKING, "lock_lost")
-
-        # FAULT
-        elif prev == SystemState.FAULT:
-            if event == "ALARM_RESET" or event == EV_FAULT_CLEARED:
-                return self._transition(SystemState.IDLE, "fault_reset") # or SELF_CHECK
-
-        # COMMISSIONING
-        elif prev == SystemState.COMMISSIONING:
-            if event == EV_COMMISSIONING_DONE:
-                return self._transition(SystemState.IDLE, "commissioning_done")
-            if event == EV_STOP:
-                return self._transition(SystemState.IDLE, "stop_command")
+        # --- State Logic: one lookup in the transition table ---
+        entry = _TRANSITIONS.get((prev, event))
+        if entry is not None:
+            return self._transition(*entry)
 
         # Default: No change
         return TransitionResult(prev, self.state, False, "ignored")
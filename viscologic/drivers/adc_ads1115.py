@@ -4,10 +4,37 @@
 
 from __future__ import annotations
 
+import math
 import time
+import bisect
+import random
 import logging
+import operator
 from typing import Dict, Any, Tuple, List, Optional
 
+try:
+    import numpy as np  # optional: batched mock samples
+except Exception:  # pragma: no cover
+    np = None
+
+# Mock channel time step per reading (~200 Hz sample rate)
+_MOCK_DT = 0.005
+
+# Settings the ADS1115 accepts, ascending
+_VALID_GAINS = (2 / 3, 1, 2, 4, 8, 16)
+_VALID_SPS = (8, 16, 32, 64, 128, 250, 475, 860)
+
+
+def _nearest(table: Tuple[Any, ...], x: float) -> Any:
+    """Entry of the sorted table closest to x (the lower one on a tie)."""
+    i = bisect.bisect_left(table, x)
+    if i == 0:
+        return table[0]
+    if i == len(table):
+        return table[-1]
+    lo, hi = table[i - 1], table[i]
+    return lo if x - lo <= hi - x else hi
+
 
 class ADS1115Driver:
     """
@@ -34,6 +61,7 @@ class ADS1115Driver:
 
         self._ads = None
         self._chan = None
+        self._mock = False
 
     # -----------------------
     # Diagnostics
@@ -113,6 +141,7 @@ class ADS1115Driver:
 
             self._ads = ads
             self._chan = chan
+            self._mock = False
 
         except Exception as e:
             # --- MOCK PATH (Windows / dev machines) ---
@@ -123,8 +152,6 @@ class ADS1115Driver:
 
             class _MockChan:
                 def __init__(self, logger):
-                    import time
-
                     self._t = 0.0
                     self.logger = logger
                     self._start_time = time.time()
@@ -137,6 +164,8 @@ class ADS1115Driver:
                     self._q_factor = 50.0  # Quality factor (higher = sharper peak)
                     self._noise_level = 0.02  # RMS noise (V)
                     self._dc_offset = 1.2  # DC offset (V)
+                    self._bandwidth = self._resonant_freq / self._q_factor  # ~3.6 Hz for Q=50
+                    self._rng = np.random.default_rng() if np is not None else None
 
                     # Simulate drive state (in real system, this comes from drive driver)
                     # For mock, we simulate typical sweep/lock behavior
@@ -146,9 +175,6 @@ class ADS1115Driver:
 
                 def _update_simulated_drive(self):
                     """Simulate drive frequency behavior (sweep, lock, etc.)"""
-                    import time
-                    import math
-
                     elapsed = time.time() - self._start_time
 
                     # Simulate sweep behavior: starts low, sweeps up, locks at resonance
@@ -172,28 +198,15 @@ class ADS1115Driver:
                         )
                         self._simulated_drive_amp = 0.3
 
-                @property
-                def voltage(self):
-                    """
-                    Simulates resonant sensor pickup signal with realistic behavior.
-                    - Higher amplitude at resonance frequency (Lorentzian response)
-                    - Includes harmonics (2nd, 3rd order)
-                    - Realistic noise characteristics
-                    - Responds to simulated drive frequency
-                    """
-                    import math
-                    import random
-
-                    dt = 0.005  # ~200 Hz sample rate
-                    self._t += dt
-
+                def _drive_response(self) -> Tuple[float, float]:
+                    """Current (drive_freq, base_amp) of the simulated pickup."""
                     # Update simulated drive state
                     self._update_simulated_drive()
+                    drive_freq = self._simulated_drive_freq
 
                     # Calculate resonance response (Lorentzian-like curve)
-                    freq_diff = abs(self._simulated_drive_freq - self._resonant_freq)
-                    bandwidth = self._resonant_freq / self._q_factor  # ~3.6 Hz for Q=50
-                    resonance_factor = 1.0 / (1.0 + (freq_diff / bandwidth) ** 2)
+                    x = (drive_freq - self._resonant_freq) / self._bandwidth
+                    resonance_factor = 1.0 / (1.0 + x * x)
 
                     # Base signal amplitude depends on resonance and drive strength
                     # At resonance: full amplitude, off-resonance: reduced
@@ -202,20 +215,22 @@ class ADS1115Driver:
                         * (0.3 + 0.7 * resonance_factor)
                         * self._simulated_drive_amp
                     )
+                    return drive_freq, base_amp
 
+                def _sample(self, t: float, drive_freq: float, base_amp: float) -> float:
+                    sin = math.sin
                     # Generate signal at drive frequency (fundamental)
-                    phase = 2.0 * math.pi * self._simulated_drive_freq * self._t
-                    signal = base_amp * math.sin(phase)
-
-                    # Add harmonics (2nd and 3rd) - typical in real resonant sensors
-                    # Harmonics are weaker and phase-shifted
-                    signal += 0.12 * base_amp * math.sin(phase * 2.0 + 0.3)
-                    signal += 0.04 * base_amp * math.sin(phase * 3.0 + 0.6)
+                    phase = 2.0 * math.pi * drive_freq * t
+                    # Fundamental plus weaker, phase-shifted 2nd and 3rd
+                    # harmonics - typical in real resonant sensors
+                    signal = base_amp * (
+                        sin(phase)
+                        + 0.12 * sin(phase * 2.0 + 0.3)
+                        + 0.04 * sin(phase * 3.0 + 0.6)
+                    )
 
                     # Add low-frequency drift (thermal expansion, mechanical drift)
-                    drift = 0.015 * math.sin(self._t * 0.05) + 0.01 * math.sin(
-                        self._t * 0.2
-                    )
+                    drift = 0.015 * sin(t * 0.05) + 0.01 * sin(t * 0.2)
 
                     # Add realistic noise (Gaussian + occasional spikes)
                     noise = random.gauss(0.0, self._noise_level)
@@ -229,12 +244,56 @@ class ADS1115Driver:
                     # Clamp to realistic ADC range (0-3.3V for typical setup)
                     return max(0.0, min(3.3, total))
 
+                @property
+                def voltage(self):
+                    """
+                    Simulates resonant sensor pickup signal with realistic behavior.
+                    - Higher amplitude at resonance frequency (Lorentzian response)
+                    - Includes harmonics (2nd, 3rd order)
+                    - Realistic noise characteristics
+                    - Responds to simulated drive frequency
+                    """
+                    self._t += _MOCK_DT
+                    return self._sample(self._t, *self._drive_response())
+
+                def samples(self, n: int) -> List[float]:
+                    """
+                    n consecutive readings in one call, the drive state held
+                    for the block. Same signal model as .voltage.
+                    """
+                    drive_freq, base_amp = self._drive_response()
+                    t0 = self._t
+                    self._t += n * _MOCK_DT
+                    if np is None:
+                        return [
+                            self._sample(t0 + (i + 1) * _MOCK_DT, drive_freq, base_amp)
+                            for i in range(n)
+                        ]
+
+                    t = t0 + _MOCK_DT * np.arange(1, n + 1)
+                    phase = (2.0 * math.pi * drive_freq) * t
+                    signal = base_amp * (
+                        np.sin(phase)
+                        + 0.12 * np.sin(phase * 2.0 + 0.3)
+                        + 0.04 * np.sin(phase * 3.0 + 0.6)
+                    )
+                    signal += 0.015 * np.sin(t * 0.05) + 0.01 * np.sin(t * 0.2)
+                    rng = self._rng
+                    signal += rng.normal(0.0, self._noise_level, n)
+                    spikes = rng.random(n) < 0.005
+                    k = int(spikes.sum())
+                    if k:
+                        signal[spikes] += rng.choice((-1.0, 1.0), k) * rng.uniform(0.03, 0.08, k)
+                    signal += self._dc_offset
+                    return np.clip(signal, 0.0, 3.3).tolist()
+
             class _MockAds:
                 def __init__(self, data_rate):
                     self.data_rate = data_rate
 
             self._ads = _MockAds(self.data_rate)
             self._chan = _MockChan(self.logger)
+            self._mock = True
 
     # -----------------------
     # Reading
@@ -263,15 +322,26 @@ class ADS1115Driver:
         self._ensure_open()
 
         count = int(n or self.samples_per_block)
-        out: List[float] = []
+        if self._mock:
+            # Simulated channel: no conversion time to wait for, one batch
+            return self._chan.samples(count)  # type: ignore[union-attr]
+
+        out: List[float] = [0.0] * count
 
         sps = float(self._ads.data_rate) if self._ads else float(self.data_rate)
-        dt = 1.0 / max(sps, 1.0)
+        delay = 0.85 / max(sps, 1.0)
+
+        # Loop-invariant lookups hoisted: call the voltage property getter
+        # directly when the channel exposes one
+        chan = self._chan
+        prop = getattr(type(chan), "voltage", None)
+        read = prop.fget if isinstance(prop, property) else operator.attrgetter("voltage")
+        sleep = time.sleep
 
-        for _ in range(count):
-            out.append(float(self._chan.voltage))  # type: ignore[union-attr]
+        for i in range(count):
+            out[i] = float(read(chan))
             if sleep_hint:
-                time.sleep(dt * 0.85)
+                sleep(delay)
 
         return out
 
@@ -285,7 +355,8 @@ class ADS1115Driver:
             return int(s)
         return int(v)
 
-    def _parse_gain(self, g: Any) -> int:
+    @staticmethod
+    def _parse_gain(g: Any) -> int:
         """
         Adafruit expects gain in {2/3,1,2,4,8,16}
         We'll clamp to valid set.
@@ -294,19 +365,8 @@ class ADS1115Driver:
             gv = float(g)
         except Exception:
             gv = 1.0
+        return _nearest(_VALID_GAINS, gv)  # type: ignore
 
-        valid = [2 / 3, 1, 2, 4, 8, 16]
-        # choose nearest
-        best = valid[0]
-        for v in valid:
-            if abs(gv - v) < abs(gv - best):
-                best = v
-        return best  # type: ignore
-
-    def _closest_data_rate(self, sps: int) -> int:
-        valid = [8, 16, 32, 64, 128, 250, 475, 860]
-        best = valid[0]
-        for v in valid:
-            if abs(int(sps) - v) < abs(int(sps) - best):
-                best = v
-        return best
+    @staticmethod
+    def _closest_data_rate(sps: int) -> int:
+        return _nearest(_VALID_SPS, int(sps))
@@ -4,12 +4,18 @@
 
 from __future__ import annotations
 
+import os
 import logging
-import threading
 from typing import Any, Dict, List, Optional, Tuple
 
 import numpy as np
 
+# Periodic input peak report from the audio callback (dev aid; read once)
+_DEBUG_PEAK = os.environ.get("VISCO_AUDIO_DEBUG", "0") == "1"
+
+# Capture history kept by the audio callback (samples; power of two)
+_RING_SIZE = 1 << 16
+
 try:
     import sounddevice as sd
 except ImportError:
@@ -45,8 +51,11 @@ class AudioADCDriver:
         self.gain = float(self.cfg.get("gain", 1.0))
 
         self._stream = None
-        self._latest_sample = 0.0
-        self._lock = threading.Lock()
+        # Single-producer ring: the audio callback fills samples, then
+        # publishes them with one store to _write_idx (total samples
+        # written). Readers only look below _write_idx, so no lock.
+        self._ring = np.zeros(_RING_SIZE, dtype=np.float32)
+        self._write_idx = 0
         self._is_open = False
         self._debug_counter = 0
 
@@ -132,28 +141,32 @@ class AudioADCDriver:
         if status:
             pass  # self.logger.warning(f"Audio status: {status}")
 
-        if len(indata) > 0:
-            # Take the last sample (or average of last N)
-            # Orchestrator runs slower than audio, so we just want the 'current' voltage.
-            # Using the very last sample is the most "real-time"
-            val = float(indata[-1, 0]) * self.gain
-
-            with self._lock:
-                self._latest_sample = val
-
-            # --- DEBUG: Print peak level every so often ---
-            self._debug_counter += 1
-
-            if (
-                self._debug_counter % 40 == 0
-            ):  # approx every 0.5-1s depending on block size
-                peak = np.max(np.abs(indata))
-                if peak < 0.001:
-                    print(f"[DEBUG ADC] Audio Input is SILENT (Peak: {peak:.6f})")
-                else:
-                    print(
-                        f"[DEBUG ADC] Audio Input active. Peak: {peak:.4f} (Gain={self.gain} -> {peak * self.gain:.4f})"
-                    )
+        n = len(indata)
+        if n > 0:
+            # Orchestrator runs slower than audio: keep the block history and
+            # let readers take the most recent sample(s)
+            src = indata[-_RING_SIZE:, 0]
+            n = len(src)
+            start = self._write_idx
+            i = start & (_RING_SIZE - 1)
+            first = min(n, _RING_SIZE - i)
+            np.multiply(src[:first], self.gain, out=self._ring[i:i + first])
+            if first < n:
+                np.multiply(src[first:], self.gain, out=self._ring[:n - first])
+            self._write_idx = start + n
+
+            # --- DEBUG: Log peak level every so often ---
+            if _DEBUG_PEAK:
+                self._debug_counter += 1
+                if self._debug_counter % 40 == 0:  # approx every 0.5-1s depending on block size
+                    peak = float(np.max(np.abs(indata)))
+                    if peak < 0.001:
+                        self.logger.debug("Audio Input is SILENT (Peak: %.6f)", peak)
+                    else:
+                        self.logger.debug(
+                            "Audio Input active. Peak: %.4f (Gain=%s -> %.4f)",
+                            peak, self.gain, peak * self.gain,
+                        )
             # ----------------------------------------------
 
     # -----------------------
@@ -166,8 +179,10 @@ class AudioADCDriver:
         Audio usually -1.0 to 1.0.
         """
         self._ensure_open()
-        with self._lock:
-            return float(self._latest_sample)
+        idx = self._write_idx
+        if idx == 0:
+            return 0.0
+        return float(self._ring[(idx - 1) & (_RING_SIZE - 1)])
 
     def read(self) -> float:
         return self.read_sample_volts()
@@ -175,5 +190,18 @@ class AudioADCDriver:
     def read_samples(
         self, n: Optional[int] = None, sleep_hint: bool = True
     ) -> List[float]:
-        s = self.read_sample_volts()
-        return [s] * (n or 1)
+        """
+        Most recent n captured samples, oldest first (fewer if the stream
+        has not produced n yet). Does not wait for new audio.
+        """
+        self._ensure_open()
+        idx = self._write_idx
+        # Leave one callback block of headroom so the writer can't lap us
+        n = min(int(n or 1), idx, _RING_SIZE - self.chunk)
+        if n <= 0:
+            return [0.0]
+        end = idx & (_RING_SIZE - 1)
+        start = end - n
+        if start >= 0:
+            return self._ring[start:end].tolist()
+        return self._ring[start:].tolist() + self._ring[:end].tolist()
@@ -39,6 +39,8 @@ class AudioDriveDriver:
         self.rate = int(self.cfg.get("rate", 44100))
         self.output_device_index = self.cfg.get("output_device_index", None)
         self.gain = float(self.cfg.get("gain", 1.0))  # Master volume trim
+        # Frames per callback; 0 lets the host pick (may vary per callback)
+        self.blocksize = int(self.cfg.get("blocksize", 0))
 
         self._stream = None
         self._is_open = False
@@ -48,6 +50,11 @@ class AudioDriveDriver:
         self._freq = 100.0
         self._amp = 0.0
         self._phase = 0.0
+        # Per-buffer phasor steps exp(1j * k * phase_inc), k = 0..frames-1,
+        # rebuilt only when the frequency or the buffer size changes
+        self._phasor_key: Optional[Tuple[float, int]] = None
+        self._phasor_steps: Any = None
+        self._phasor_buf: Any = None  # callback scratch, same shape as steps
 
         # Lock for parameter updates
         self._lock = threading.Lock()
@@ -147,6 +154,7 @@ class AudioDriveDriver:
                 samplerate=self.rate,
                 channels=1,
                 dtype="float32",
+                blocksize=self.blocksize,
                 callback=self._audio_callback,
                 device=self.output_device_index,
             )
@@ -173,24 +181,24 @@ class AudioDriveDriver:
             outdata.fill(0)
             return
 
-        # Generate time steps
-        # t = np.arange(frames) / self.rate
-        # We need continuous phase tracking
-        # phase_increment = 2 * pi * freq / rate
-
+        # Continuous phase tracking: phase_increment = 2 * pi * freq / rate.
+        # sin(phase + k*inc) = Im(exp(1j*phase) * exp(1j*k*inc)); the step
+        # table is cached, so a buffer costs one complex multiply per sample
+        # instead of a sin() per sample.
         phase_inc = 2 * np.pi * freq / self.rate
-        phase_end = self._phase + (phase_inc * frames)
-
-        # Create phase array: starts at self._phase, increments by phase_inc
-        phases = np.linspace(self._phase, phase_end, frames, endpoint=False)
+        key = (freq, frames)
+        if key != self._phasor_key:
+            self._phasor_steps = np.exp(1j * phase_inc * np.arange(frames))
+            if self._phasor_buf is None or len(self._phasor_buf) != frames:
+                self._phasor_buf = np.empty(frames, dtype=np.complex128)
+            self._phasor_key = key
 
-        # Sine wave
-        # Output = amp * sin(phases)
-        # Apply master gain
-        sig = (amp * self.gain) * np.sin(phases)
+        # In place: no array allocation per callback
+        z = self._phasor_buf
+        np.multiply(self._phasor_steps, np.exp(1j * self._phase), out=z)
 
-        # Reshape for output (frames, channels)
-        outdata[:] = sig.reshape(-1, 1)
+        # Output = amp * sin(phases), with master gain; (frames, channels)
+        np.multiply(z.imag, amp * self.gain, out=outdata[:, 0], casting="same_kind")
 
         # Wrap phase to keep precision
-        self._phase = phase_end % (2 * np.pi)
+        self._phase = (self._phase + phase_inc * frames) % (2 * np.pi)
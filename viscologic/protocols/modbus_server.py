@@ -3,10 +3,11 @@
 
 from __future__ import annotations
 import time
+import struct
 import threading
 import logging
 import traceback
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Sequence, Tuple
 
 from viscologic.protocols.register_map import (
     RegisterBank, HOLDING_REG_COUNT, set_defaults,
@@ -65,6 +66,11 @@ class ModbusServer:
         self._ctx = None
         self._stop_event = threading.Event()
         self._last_seen_cmd_seq = 0
+        self._last_frame_seq: Optional[int] = None
+
+        # Live register blocks packed by the orchestrator every tick:
+        # (start address, buffer of big-endian u16 words, unpacker)
+        self._live_blocks: Tuple[Tuple[int, bytearray, struct.Struct], ...] = ()
 
     def start(self):
         self._stop_event.clear()
@@ -124,15 +130,32 @@ class ModbusServer:
             time.sleep(0.1)
 
     def _push_frame(self):
+        # Re-encode the measurement registers only when a new frame arrived
+        seq = None
         try:
-            frame = self.bus.get_latest_frame()
+            get_seq = getattr(self.bus, "get_latest_frame_seq", None)
+            if get_seq is not None:
+                seq, frame = get_seq()
+            else:
+                frame = self.bus.get_latest_frame()
         except Exception:
             frame = {}
+        fresh = seq is None or seq != self._last_frame_seq
+        self._last_frame_seq = seq
 
         with self._lock:
-            encode_measurement(self._bank, frame)
+            if fresh:
+                encode_measurement(self._bank, frame)
+            self._apply_live_blocks()
             bump_heartbeat(self._bank)
 
+    def _apply_live_blocks(self) -> None:
+        # Caller holds self._lock. unpack_from is a single C call, so it never
+        # observes a half-packed buffer from the tick thread.
+        regs = self._bank.regs
+        for addr, buf, unpacker in self._live_blocks:
+            regs[addr:addr + len(buf) // 2] = unpacker.unpack_from(buf)
+
     def _handle_plc_command(self):
         with self._lock:
             last_seen, decoded = decode_new_command(self._bank, self._last_seen_cmd_seq)
@@ -207,6 +230,12 @@ class ModbusServer:
         with self._lock:
             self._bank.set_u16(address, value)
     
+    def write_multiple_registers(self, address: int, values: Sequence[int]) -> None:
+        """Set a contiguous run of holding registers under one lock acquire."""
+        with self._lock:
+            for i, value in enumerate(values):
+                self._bank.set_u16(address + i, value)
+
     def read_holding_register(self, address: int) -> int:
         """Alias for get_holding_register (for orchestrator compatibility)."""
         return self.get_holding_register(address)
@@ -215,6 +244,20 @@ class ModbusServer:
         """Alias for set_holding_register (for orchestrator compatibility)."""
         self.set_holding_register(address, value)
     
+    def attach_live_block(self, address: int, buf: bytearray) -> None:
+        """
+        Mirror a caller-owned buffer of big-endian u16 words into the holding
+        registers starting at `address`. The caller rewrites the buffer in
+        place (struct.pack_into) without taking any lock; the update loop
+        copies it into the bank on its own schedule.
+        """
+        n = len(buf) // 2
+        if n <= 0 or address < 0 or address + n > len(self._bank.regs):
+            raise ValueError(f"live block out of range: addr={address} words={n}")
+        block = (int(address), buf, struct.Struct(f">{n}H"))
+        with self._lock:
+            self._live_blocks = self._live_blocks + (block,)
+
     def get_register_bank(self) -> RegisterBank:
         """
         Get the internal register bank (for direct access if needed).
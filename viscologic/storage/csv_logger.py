@@ -5,16 +5,22 @@ from __future__ import annotations
 
 import os
 import csv
+import json
 import time
 import threading
 import logging
-from typing import Any, Dict, Optional, List
+from typing import Any, Dict, Iterable, Optional, List
 
 
 def now_ms() -> int:
     return int(time.time() * 1000)
 
 
+_LOCKED_KEYS = frozenset(
+    ("timestamp_ms", "viscosity_cp", "temp_c", "freq_hz", "health_pct", "status_word", "alarm_word")
+)
+
+
 def _date_str(ts: Optional[float] = None) -> str:
     t = time.localtime(ts or time.time())
     return time.strftime("%Y-%m-%d", t)
@@ -45,17 +51,39 @@ class CsvLogger:
         "extra_json",
     ]
 
-    def __init__(self, csv_dir: str, logger: Optional[logging.Logger] = None, flush_every_n: int = 10):
+    # Userspace write buffer; rows reach the OS on flush, not per row
+    BUFFER_BYTES = 64 * 1024
+
+    def __init__(
+        self,
+        csv_dir: str,
+        logger: Optional[logging.Logger] = None,
+        flush_every_n: int = 10,
+        flush_interval_s: Optional[float] = None,
+        fsync_interval_s: float = 0.0,
+    ):
+        """
+        flush_every_n:    flush to the OS every N rows (default policy).
+        flush_interval_s: if set, flush on elapsed time instead of row count.
+        fsync_interval_s: if > 0, also fsync at most this often (0 = never).
+        """
         self.csv_dir = csv_dir
         self.logger = logger or logging.getLogger("viscologic.csv_logger")
-        self.flush_every_n = int(flush_every_n)
+        self.flush_every_n = max(1, int(flush_every_n))
+        self.flush_interval_s = float(flush_interval_s) if flush_interval_s else None
+        self.fsync_interval_s = float(fsync_interval_s or 0.0)
+        self._last_flush = 0.0
+        self._last_fsync = 0.0
 
         self._lock = threading.RLock()
         self._enabled = False
         self._file = None
-        self._writer: Optional[csv.DictWriter] = None
+        self._writer = None  # csv.writer; rows are lists in DEFAULT_FIELDS order
         self._current_date = ""
         self._write_count = 0
+        # iso_time only changes once per second; reuse the last strftime result
+        self._iso_sec = -1
+        self._iso_str = ""
 
         os.makedirs(self.csv_dir, exist_ok=True)
 
@@ -92,14 +120,15 @@ class CsvLogger:
         path = os.path.join(self.csv_dir, fname)
 
         is_new = not os.path.exists(path)
-        self._file = open(path, "a", newline="", encoding="utf-8")
-        self._writer = csv.DictWriter(self._file, fieldnames=self.DEFAULT_FIELDS)
+        self._file = open(path, "a", newline="", encoding="utf-8", buffering=self.BUFFER_BYTES)
+        self._writer = csv.writer(self._file)
 
         if is_new:
-            self._writer.writeheader()
+            self._writer.writerow(self.DEFAULT_FIELDS)
             self._file.flush()
 
         self._write_count = 0
+        self._last_flush = self._last_fsync = time.monotonic()
 
     def _close(self) -> None:
         try:
@@ -116,9 +145,16 @@ class CsvLogger:
         """
         Returns True if written, False if logging disabled.
         """
+        return self.log_frames((frame,)) > 0
+
+    def log_frames(self, frames: Iterable[Dict[str, Any]]) -> int:
+        """
+        Batch write: one lock acquire + writerows() for many frames.
+        Returns number of rows written (0 if logging disabled).
+        """
         with self._lock:
             if not self._enabled:
-                return False
+                return 0
 
             # rotate daily if day changed
             if _date_str() != self._current_date:
@@ -128,49 +164,64 @@ class CsvLogger:
                 # Should not happen, but keep safe
                 self._open_for_today()
                 if not self._writer or not self._file:
-                    return False
+                    return 0
 
-            row = self._make_row(frame)
+            rows = [self._make_row(f) for f in frames]
             try:
-                self._writer.writerow(row)
-                self._write_count += 1
-
-                if self._write_count % self.flush_every_n == 0:
-                    self._file.flush()
-
-                return True
+                self._writer.writerows(rows)
+                before = self._write_count
+                self._write_count += len(rows)
+
+                if self.flush_interval_s is None:
+                    due = self._write_count // self.flush_every_n != before // self.flush_every_n
+                    if due:
+                        self._file.flush()
+                else:
+                    now = time.monotonic()
+                    if now - self._last_flush >= self.flush_interval_s:
+                        self._file.flush()
+                        self._last_flush = now
+
+                if self.fsync_interval_s > 0:
+                    now = time.monotonic()
+                    if now - self._last_fsync >= self.fsync_interval_s:
+                        self._file.flush()
+                        os.fsync(self._file.fileno())
+                        self._last_fsync = now
+
+                return len(rows)
             except Exception:
                 self.logger.error("CSV write failed", exc_info=True)
-                return False
+                return 0
 
-    def _make_row(self, frame: Dict[str, Any]) -> Dict[str, Any]:
+    def _iso_time(self, ts_ms: int) -> str:
+        sec = ts_ms // 1000
+        if sec != self._iso_sec:
+            self._iso_sec = sec
+            self._iso_str = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(sec))
+        return self._iso_str
+
+    def _make_row(self, frame: Dict[str, Any]) -> List[Any]:
         ts_ms = int(frame.get("timestamp_ms", now_ms()))
-        iso_time = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(ts_ms / 1000.0))
-
-        # locked columns
-        row: Dict[str, Any] = {
-            "timestamp_ms": ts_ms,
-            "iso_time": iso_time,
-            "viscosity_cp": float(frame.get("viscosity_cp", 0.0) or 0.0),
-            "temp_c": float(frame.get("temp_c", 0.0) or 0.0),
-            "freq_hz": float(frame.get("freq_hz", 0.0) or 0.0),
-            "health_pct": int(frame.get("health_pct", 0) or 0),
-            "status_word": int(frame.get("status_word", 0) or 0),
-            "alarm_word": int(frame.get("alarm_word", 0) or 0),
-        }
 
         # extra keys -> extra_json
-        extras = {}
-        for k, v in frame.items():
-            if k in ("timestamp_ms", "viscosity_cp", "temp_c", "freq_hz", "health_pct", "status_word", "alarm_word"):
-                continue
-            extras[k] = v
+        extras = {k: v for k, v in frame.items() if k not in _LOCKED_KEYS}
 
         # store extra as compact string
         try:
-            import json
-            row["extra_json"] = json.dumps(extras, ensure_ascii=False, separators=(",", ":"))
+            extra_json = json.dumps(extras, ensure_ascii=False, separators=(",", ":"))
         except Exception:
-            row["extra_json"] = str(extras)
-
-        return row
+            extra_json = str(extras)
+
+        # locked columns, DEFAULT_FIELDS order
+        return [
+            ts_ms,
+            self._iso_time(ts_ms),
+            float(frame.get("viscosity_cp", 0.0) or 0.0),
+            float(frame.get("temp_c", 0.0) or 0.0),
+            float(frame.get("freq_hz", 0.0) or 0.0),
+            int(frame.get("health_pct", 0) or 0),
+            int(frame.get("status_word", 0) or 0),
+            int(frame.get("alarm_word", 0) or 0),
+            extra_json,
+        ]
@@ -22,10 +22,26 @@ def now_ms() -> int:
     return int(time.time() * 1000)
 
 
+_SYNC_MODES = ("OFF", "NORMAL", "FULL", "EXTRA")
+
+# Shared by log_event / log_events (one statement text for both)
+_INSERT_EVENT_SQL = "INSERT INTO events(ts_ms, type, details_json) VALUES(?,?,?);"
+
+
 class SqliteStore:
-    def __init__(self, db_path: str, logger: Optional[logging.Logger] = None):
+    def __init__(
+        self,
+        db_path: str,
+        logger: Optional[logging.Logger] = None,
+        synchronous: str = "NORMAL",
+    ):
         self.db_path = db_path
         self.logger = logger or logging.getLogger("viscologic.sqlite")
+
+        # NORMAL under WAL only risks the last commits on power loss, never
+        # corruption; FULL fsyncs every commit. See storage.sqlite.synchronous.
+        sync = str(synchronous or "NORMAL").upper()
+        self._synchronous = sync if sync in _SYNC_MODES else "NORMAL"
         self._lock = threading.RLock()
         
         # Internal state to support separate last_row_id() calls
@@ -43,10 +59,11 @@ class SqliteStore:
     def _connect(self) -> sqlite3.Connection:
         conn = sqlite3.connect(self.db_path, timeout=10, isolation_level=None)
         conn.row_factory = sqlite3.Row
-        # Basic pragmas for reliability/performance
-        conn.execute("PRAGMA journal_mode=WAL;")
-        conn.execute("PRAGMA synchronous=NORMAL;")
+        # Per-connection pragmas (journal_mode=WAL is persistent, set in init_db;
+        # the lock wait comes from timeout= above)
+        conn.execute(f"PRAGMA synchronous={self._synchronous};")
         conn.execute("PRAGMA foreign_keys=ON;")
+        conn.execute("PRAGMA temp_store=MEMORY;")
         return conn
 
     def init_db(self) -> None:
@@ -54,6 +71,8 @@ class SqliteStore:
         with self._lock:
             conn = self._connect()
             try:
+                # WAL is stored in the DB file; once is enough
+                conn.execute("PRAGMA journal_mode=WAL;")
                 conn.executescript(
                     """
                     CREATE TABLE IF NOT EXISTS meta (
@@ -427,7 +446,7 @@ class SqliteStore:
             conn = self._connect()
             try:
                 conn.execute(
-                    "INSERT INTO events(ts_ms, type, details_json) VALUES(?,?,?);",
+                    _INSERT_EVENT_SQL,
                     (t, event_type, details_json),
                 )
                 rid = conn.execute("SELECT last_insert_rowid() AS id;").fetchone()["id"]
@@ -435,6 +454,33 @@ class SqliteStore:
             finally:
                 conn.close()
 
+    def log_events(self, events: List[Tuple[int, str, Optional[Dict[str, Any]]]]) -> int:
+        """
+        Insert many (ts_ms, type, details) events in a single transaction.
+        Used by the orchestrator's background flusher so high-rate samples
+        cost one commit per batch instead of one per row. Returns row count.
+        """
+        if not events:
+            return 0
+        rows = [
+            (int(ts or now_ms()), event_type, json.dumps(details or {}, ensure_ascii=False))
+            for ts, event_type, details in events
+        ]
+
+        with self._lock:
+            conn = self._connect()
+            try:
+                conn.execute("BEGIN;")
+                try:
+                    conn.executemany(_INSERT_EVENT_SQL, rows)
+                    conn.execute("COMMIT;")
+                except Exception:
+                    conn.execute("ROLLBACK;")
+                    raise
+                return len(rows)
+            finally:
+                conn.close()
+
     def list_events(self, limit: int = 200) -> List[Dict[str, Any]]:
         with self._lock:
             conn = self._connect()
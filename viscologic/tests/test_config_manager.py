@@ -0,0 +1,77 @@
+# viscologic/tests/test_config_manager.py
+# Unit tests for core/config_manager.py
+
+import os
+import tempfile
+import unittest
+
+from viscologic.core.config_manager import ConfigManager, _deep_merge
+
+
+class TestConfigManager(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.mgr = ConfigManager(base_dir=self.tmp.name)
+        self.mgr.settings_path = os.path.join(self.tmp.name, "missing.yaml")
+        self.mgr.schema_path = os.path.join(self.tmp.name, "missing.json")
+        self.mgr.load()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_get_dot_path(self):
+        self.assertEqual(self.mgr.get("app.tick_ms"), 100)
+        self.assertEqual(self.mgr.get("modbus.port"), 5020)
+        self.assertIsInstance(self.mgr.get("safety"), dict)
+
+    def test_get_missing_returns_default(self):
+        self.assertIsNone(self.mgr.get("app.nope"))
+        self.assertEqual(self.mgr.get("app.tick_ms.deeper", 7), 7)
+
+    def test_set_then_get(self):
+        self.mgr.set("dsp.target_freq_hz", 175.0)
+        self.assertEqual(self.mgr.get("dsp.target_freq_hz"), 175.0)
+        self.assertEqual(self.mgr.get("dsp"), {"target_freq_hz": 175.0})
+
+        self.mgr.set("app.tick_ms", 50)
+        self.assertEqual(self.mgr.get("app.tick_ms"), 50)
+
+    def test_section_get_returns_live_section(self):
+        section = self.mgr.get("safety")
+        self.assertIs(section, self.mgr.get("safety"))
+        self.assertEqual(section["max_current_ma"], 150)
+
+        self.mgr.set("safety", {"max_current_ma": 90})
+        self.assertEqual(self.mgr.get("safety"), {"max_current_ma": 90})
+        self.assertEqual(self.mgr.get("safety.max_current_ma"), 90)
+        self.assertIsNone(self.mgr.get("safety.air_cal_max_sec"))
+
+    def test_set_does_not_leak_into_defaults(self):
+        self.mgr.set("safety.max_current_ma", 42)
+        other = ConfigManager(base_dir=self.tmp.name)
+        other.settings_path = self.mgr.settings_path
+        other.schema_path = self.mgr.schema_path
+        other.load()
+        self.assertEqual(other.get("safety.max_current_ma"), 150)
+
+    def test_attach_uses_dict_without_reload(self):
+        mgr = ConfigManager(base_dir=self.tmp.name)
+        cfg = {"app": {"mode": "inline"}}
+        mgr.attach(cfg)
+        self.assertEqual(mgr.get("app.mode"), "inline")
+        mgr.set("app.mode", "tabletop")
+        self.assertEqual(cfg["app"]["mode"], "tabletop")
+
+        # Direct changes to the attached dict are seen by get()
+        cfg["app"]["mode"] = "inline"
+        self.assertEqual(mgr.get("app.mode"), "inline")
+
+    def test_deep_merge_in_place(self):
+        base = {"a": {"x": 1, "y": 2}, "b": 1}
+        out = _deep_merge(base, {"a": {"y": 3}, "c": 4})
+        self.assertIs(out, base)
+        self.assertEqual(base, {"a": {"x": 1, "y": 3}, "b": 1, "c": 4})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,73 @@
+# viscologic/tests/test_diagnostics.py
+# Unit tests for core/diagnostics.py
+
+import tempfile
+import unittest
+
+from viscologic.core.diagnostics import CheckItem, Diagnostics, DiagSample
+
+
+class TestRuntimeChecks(unittest.TestCase):
+    def setUp(self):
+        self.diag = Diagnostics({"safety": {"max_temp_c": 50.0}})
+
+    def test_temp_range(self):
+        rep = self.diag.run_runtime_checks({"temp_c": 40.0})
+        self.assertTrue(rep.overall_ok)
+
+        rep = self.diag.run_runtime_checks({"temp_c": 60.0})
+        self.assertFalse(rep.overall_ok)
+        self.assertIn("Overtemp", rep.items["temp_range"].details)
+
+    def test_missing_and_bad_temp(self):
+        self.assertTrue(self.diag.run_runtime_checks({}).overall_ok)
+        self.assertFalse(self.diag.run_runtime_checks({"temp_c": "n/a"}).overall_ok)
+
+    def test_steady_state_reuses_report(self):
+        a = self.diag.run_runtime_checks({"temp_c": 40.0})
+        a_ts = a.ts_ms
+        b = self.diag.run_runtime_checks({"temp_c": 40.0})
+        self.assertIs(a.items, b.items)
+        self.assertEqual(a.ts_ms, a_ts)  # earlier reports are not restamped
+
+        c = self.diag.run_runtime_checks({"temp_c": 40.0, "signal_clip": True})
+        self.assertIsNot(c, b)
+        self.assertFalse(c.overall_ok)
+
+
+class TestDiagUpdate(unittest.TestCase):
+    def test_update_keeps_latest_sample(self):
+        diag = Diagnostics({})
+        self.assertIsNone(diag.last_sample())
+
+        sample = DiagSample(viscosity_cp=12.5, locked=True)
+        diag.update(sample)
+        sample.viscosity_cp = 13.0
+        diag.update(sample)
+
+        self.assertIs(diag.last_sample(), sample)
+        self.assertEqual(diag.last_sample().viscosity_cp, 13.0)
+        self.assertEqual(diag.sample_count, 2)
+
+
+class TestStartupChecks(unittest.TestCase):
+    def test_self_check_reprobes_unless_cache_requested(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        diag = Diagnostics({"diagnostics": {"probe_cache_s": 60.0}, "paths": {"data_dir": tmp.name}})
+        calls = []
+
+        def probe():
+            calls.append(1)
+            return CheckItem(name="adc_present", ok=len(calls) > 1)
+
+        diag._check_adc_present_soft = probe
+        self.assertFalse(diag.run_startup_checks().items["adc_present"].ok)
+        # Sensor reseated: an explicit self-check sees it
+        self.assertTrue(diag.run_startup_checks().items["adc_present"].ok)
+        self.assertTrue(diag.run_startup_checks(use_probe_cache=True).items["adc_present"].ok)
+        self.assertEqual(len(calls), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
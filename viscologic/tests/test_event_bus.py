@@ -0,0 +1,134 @@
+# viscologic/tests/test_event_bus.py
+# Unit tests for core/event_bus.py
+
+import gc
+import unittest
+
+from viscologic.core.event_bus import Command, EventBus
+
+
+class TestEventBus(unittest.TestCase):
+    def test_frame_subscribe_unsubscribe(self):
+        bus = EventBus()
+        got = []
+        cb = got.append
+
+        bus.subscribe_frames(cb)
+        bus.publish_frame({"viscosity_cp": 1.5})
+        self.assertEqual(len(got), 1)
+        self.assertEqual(got[0]["viscosity_cp"], 1.5)
+        self.assertIn("timestamp_ms", got[0])
+
+        bus.unsubscribe_frames(cb)
+        bus.publish_frame({"viscosity_cp": 2.0})
+        self.assertEqual(len(got), 1)
+
+    def test_latest_frame_seq(self):
+        bus = EventBus()
+        seq0, _ = bus.get_latest_frame_seq()
+        bus.publish_frame({"viscosity_cp": 1.0})
+        seq1, frame = bus.get_latest_frame_seq()
+        self.assertGreater(seq1, seq0)
+        self.assertIs(frame, bus.get_latest_frame())
+
+        bus.publish_frame({"viscosity_cp": 2.0})
+        seq2, frame = bus.get_latest_frame_seq()
+        self.assertGreater(seq2, seq1)
+        self.assertEqual(frame["viscosity_cp"], 2.0)
+        self.assertEqual(bus.get_latest_frame_seq()[0], seq2)
+
+    def test_bound_method_subscriber_is_strong_by_default(self):
+        bus = EventBus()
+        got = []
+
+        class Adapter:
+            def on_frame(self, frame):
+                got.append(frame)
+
+        bus.subscribe_frames(Adapter().on_frame)  # only the bus references it
+        gc.collect()
+        bus.publish_frame({"viscosity_cp": 1.0})
+        self.assertEqual(len(got), 1)
+
+    def test_weak_bound_method_subscriber(self):
+        bus = EventBus()
+        got = []
+
+        class Widget:
+            def on_frame(self, frame):
+                got.append(frame)
+
+        w = Widget()
+        bus.subscribe_frames(w.on_frame, weak=True)
+        bus.subscribe_frames(lambda f: got.append("lambda"))  # kept alive by the bus
+        bus.publish_frame({"viscosity_cp": 1.0})
+        self.assertEqual(len(got), 2)
+
+        del w
+        gc.collect()
+        bus.publish_frame({"viscosity_cp": 2.0})
+        self.assertEqual(got[-1], "lambda")
+        self.assertEqual(len(got), 3)
+        self.assertEqual(len(bus._frame_subs), 1)
+
+    def test_topic_publish(self):
+        bus = EventBus()
+        got = []
+        bus.subscribe("ui/start", got.append)
+        bus.subscribe("ui/start", got.append)  # duplicate ignored
+        bus.publish("ui/start", {"x": 1})
+        bus.publish("ui/other", {"x": 2})
+        self.assertEqual(got, [{"x": 1}])
+
+    def test_topic_unsubscribe(self):
+        bus = EventBus()
+        a, b = [], []
+        bus.subscribe("ui/start", a.append)
+        bus.subscribe("ui/stop", b.append)
+        bus.unsubscribe("ui/start", a.append)
+        bus.publish("ui/start", 1)
+        bus.publish("ui/stop", 2)
+        self.assertEqual(a, [])
+        self.assertEqual(b, [2])
+
+    def test_frame_topic_routes_to_frame_subs(self):
+        bus = EventBus()
+        got = []
+        bus.subscribe("ui.frame", got.append)
+        bus.publish("frame", {"temp_c": 30.0})
+        self.assertEqual(len(got), 1)
+        self.assertEqual(bus.get_latest_frame()["temp_c"], 30.0)
+
+    def test_bad_subscriber_does_not_break_publish(self):
+        bus = EventBus()
+        got = []
+
+        def bad(_frame):
+            raise RuntimeError("boom")
+
+        bus.subscribe_frames(bad)
+        bus.subscribe_frames(got.append)
+        bus.publish_frame({"viscosity_cp": 1.0})
+        self.assertEqual(len(got), 1)
+
+    def test_command_queue_fifo_drops_oldest(self):
+        bus = EventBus(command_queue_max=3)
+        for i in range(3):
+            self.assertTrue(bus.push_command("LOCAL", "START", seq_id=i))
+        with self.assertLogs(bus.logger, level="WARNING"):
+            self.assertTrue(bus.push_command("LOCAL", "STOP", seq_id=3))
+        self.assertEqual(bus.cmd_dropped_count, 1)
+
+        self.assertEqual(bus.pop_command().seq_id, 1)
+        self.assertEqual([c.seq_id for c in bus.drain_commands()], [2, 3])
+        self.assertIsNone(bus.pop_command())
+        self.assertIsNone(bus.pop_command(timeout_s=0.01))
+
+
+    def test_command_zero_timestamp_is_stamped(self):
+        self.assertGreater(Command("LOCAL", "START", {}, timestamp_ms=0).timestamp_ms, 0)
+        self.assertEqual(Command("LOCAL", "START", {}, timestamp_ms=5).timestamp_ms, 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,255 @@
+# viscologic/tests/test_orchestrator.py
+# Unit tests for core/orchestrator.py (no start(): ticks and helpers are driven directly)
+
+import itertools
+import json
+import logging
+import os
+import random
+import tempfile
+import unittest
+
+from viscologic.core import orchestrator as orch
+from viscologic.core.event_bus import EventBus
+from viscologic.core.orchestrator import Orchestrator
+from viscologic.core.state_machine import SystemState
+from viscologic.protocols.register_map import RegisterBank
+
+
+class _CsvSink:
+    def __init__(self):
+        self.ts_ms = []
+
+    def log_frames(self, frames):
+        # Frames share one dict; keep only what the test checks
+        self.ts_ms.extend(f["timestamp_ms"] for f in frames)
+
+
+class _SqliteSink:
+    def __init__(self):
+        self.ts_ms = []
+
+    def log_events(self, rows):
+        self.ts_ms.extend(ts_ms for ts_ms, _, _ in rows)
+
+
+class _OrchestratorTestCase(unittest.TestCase):
+    def setUp(self):
+        # Runtime-state files live under ./data; keep them in a scratch cwd
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.addCleanup(os.chdir, os.getcwd())
+        os.chdir(tmp.name)
+
+        self.logger = logging.getLogger("viscologic.tests.orchestrator")
+        self.o = Orchestrator(
+            {
+                "storage": {
+                    "sqlite": {"path": os.path.join(tmp.name, "t.db")},
+                    "csv_logger": {"folder": os.path.join(tmp.name, "logs")},
+                },
+                "protocols": {"modbus_server": {"enabled": False}},
+            },
+            EventBus(),
+            logger=self.logger,
+        )
+
+
+class TestSampleLog(_OrchestratorTestCase):
+    def _log_rows(self, first, count):
+        for i in range(first, first + count):
+            self.o._log(i, "tabletop", 1.0, 20.0, 100.0, 0.1, 0.5, 0.0, 90.0, True, False)
+
+    def test_overflow_drops_oldest_and_stop_flushes_rest(self):
+        o = self.o
+        o.csv = csv = _CsvSink()
+        o.sqlite = db = _SqliteSink()
+        o._csv_enabled = o._sqlite_enabled = True
+
+        extra = 10
+        self._log_rows(0, orch._LOG_QUEUE_MAX + extra)
+        self.assertEqual(len(o._log_q), orch._LOG_QUEUE_MAX)
+
+        with self.assertLogs(self.logger, logging.WARNING) as cm:
+            o._drain_log_queue()
+            o._drain_log_queue()
+        self.assertEqual(
+            [r.getMessage() for r in cm.records],
+            ["Log writer fell behind; %d samples dropped" % extra],
+        )
+        self.assertEqual(o._log_dropped_reported, extra)
+        kept = [i * 1000 for i in range(extra, orch._LOG_QUEUE_MAX + extra)]
+        self.assertEqual(csv.ts_ms, kept)
+        self.assertEqual(db.ts_ms, kept)
+
+        # Rows queued after the last writer pass are written by stop(), in order
+        tail_start = orch._LOG_QUEUE_MAX + extra
+        self._log_rows(tail_start, 5)
+        with self.assertLogs(self.logger, logging.WARNING) as cm:
+            o.stop()
+            self.logger.warning("stop done")  # assertLogs needs at least one record
+        self.assertFalse([r for r in cm.records if "samples dropped" in r.getMessage()])
+        tail = [i * 1000 for i in range(tail_start, tail_start + 5)]
+        self.assertEqual(csv.ts_ms, kept + tail)
+        self.assertEqual(db.ts_ms, kept + tail)
+        self.assertFalse(o._log_q)
+
+
+class TestTempSample(_OrchestratorTestCase):
+    def _tick_fault(self, now_ns):
+        self.o._tick(self.o._tick_dt, now_ns)
+        return self.o._log_q[-1][-1]  # fault flag of the row this tick logged
+
+    def test_stale_sample_faults_and_fresh_sample_clears(self):
+        o = self.o
+        o._read_temperature = lambda: self.fail("tick read the sensor directly")
+        now_ns = 1_000_000_000_000
+
+        o._temp_latest = (25.0, False, now_ns - o._temp_stale_ns - 1)
+        with self.assertLogs(self.logger, logging.WARNING):
+            self.assertTrue(self._tick_fault(now_ns))
+        self.assertEqual(o.get_snapshot()["last_fault_reason"], "temp_sample_stale")
+
+        # The FAULT state latches; once reset, a fresh sample does not re-trip it
+        o.sm.handle_event("ALARM_RESET", {"source": "test"})
+        o._temp_latest = (25.0, False, now_ns)
+        self.assertFalse(self._tick_fault(now_ns + 1000))
+        self.assertFalse(o._temp_stale_logged)
+
+    def test_reads_sensor_until_first_sample(self):
+        o = self.o
+        reads = []
+
+        def read_temperature():
+            reads.append(1)
+            return 31.5, False
+
+        o._read_temperature = read_temperature
+        o._temp_latest = None
+        self.assertFalse(self._tick_fault(1_000_000_000_000))
+        self.assertEqual(len(reads), 1)
+        self.assertEqual(o._log_q[-1][4], 31.5)
+
+
+class _EventRecorder:
+    def __init__(self):
+        self.events = []
+
+    def handle_event(self, event, payload=None):
+        self.events.append(event)
+
+
+def _reference_cw_events(regmap, prev_dec, cw, start_edge, stop_edge):
+    # Decoded-dict edge logic _poll_modbus_commands used before the bit masks
+    decoded = regmap.decode_control_word(cw)
+    events = []
+    if decoded["start"] and (not prev_dec["start"] or not start_edge):
+        events.append("START")
+    if decoded["stop"] and (not prev_dec["stop"] or not stop_edge):
+        events.append("STOP")
+    if decoded["ack"]:
+        events.append("ALARM_ACK")
+    if decoded["reset"]:
+        events.append("ALARM_RESET")
+    return decoded, events
+
+
+class TestControlWord(_OrchestratorTestCase):
+    def test_matches_decoded_edge_logic(self):
+        o = self.o
+        regmap = RegisterBank()
+        rng = random.Random(1234)
+        o._mb_control_word_addr = 0
+        for start_edge, stop_edge in itertools.product((True, False), repeat=2):
+            o._remote_start_edge = start_edge
+            o._remote_stop_edge = stop_edge
+            o._last_control_word = 0
+            o.sm = rec = _EventRecorder()
+            prev_dec = regmap.decode_control_word(0)
+            for _ in range(2000):
+                # Mostly command bits (held or toggled), sometimes other bits too
+                cw = rng.getrandbits(4) if rng.random() < 0.8 else rng.getrandbits(16)
+                o._modbus_get_hr = lambda addr, cw=cw: cw
+                rec.events.clear()
+                o._poll_modbus_commands()
+                prev_dec, expected = _reference_cw_events(regmap, prev_dec, cw, start_edge, stop_edge)
+                self.assertEqual(rec.events, expected, (start_edge, stop_edge, cw))
+
+
+class TestStatusWord(_OrchestratorTestCase):
+    def test_published_word_matches_encode_status_word(self):
+        o = self.o
+        regmap = RegisterBank()
+        o._mb_live = True  # status word lands in _mb_status_buf
+        for running, locked, fault, remote in itertools.product((False, True), repeat=4):
+            o._publish_modbus(
+                viscosity_cp=1.0, temp_c=20.0, freq_hz=100.0, mag=0.5, confidence=90.0,
+                locked=locked, fault=fault, remote_enabled=remote, running=running,
+            )
+            expected = regmap.encode_status_word({
+                "running": running, "locked": locked, "fault": fault, "remote_enabled": remote,
+            })
+            got, = o._mb_status.unpack(o._mb_status_buf)
+            self.assertEqual(got, expected, (running, locked, fault, remote))
+
+
+def _reference_log_words(state, locked, fault):
+    # Status/alarm words as the CSV frame builder computed them before the table
+    status_word = 0
+    if state in (SystemState.SWEEPING, SystemState.LOCKING, SystemState.RUNNING):
+        status_word |= (1 << 2)  # STATUS_SWEEPING
+    if locked:
+        status_word |= (1 << 4)  # STATUS_LOCKED
+    if fault or state == SystemState.FAULT:
+        status_word |= (1 << 6)  # STATUS_FAULT_LATCHED
+    if state == SystemState.PAUSED:
+        status_word |= (1 << 5)  # STATUS_PAUSED
+    alarm_word = (1 << 5) if fault else 0  # ALARM_LOST_LOCK
+    return status_word, alarm_word
+
+
+class TestLogFrameWords(_OrchestratorTestCase):
+    def test_state_table_matches_reference(self):
+        for state in SystemState:
+            for locked, fault in itertools.product((False, True), repeat=2):
+                item = (1.0, "tabletop", state, 1.0, 20.0, 100.0, 0.1, 0.5, 0.0, 90.0, locked, fault)
+                f, = self.o._iter_log_frames([item])
+                self.assertEqual(
+                    (f["status_word"], f["alarm_word"]),
+                    _reference_log_words(state, locked, fault),
+                    (state, locked, fault),
+                )
+
+
+class TestRuntimeState(_OrchestratorTestCase):
+    def setUp(self):
+        super().setUp()
+        os.makedirs("data", exist_ok=True)
+        self.bin_path = self.o._runtime_state_path
+        self.json_path = self.o._legacy_runtime_state_path
+
+    def test_legacy_json_is_migrated_once(self):
+        with open(self.json_path, "w", encoding="utf-8") as f:
+            json.dump({"running": True, "ts": 123.5}, f)
+
+        self.assertTrue(self.o._load_runtime_state()["running"])
+        self.assertFalse(os.path.exists(self.json_path))
+        self.assertTrue(os.path.exists(self.json_path + ".migrated"))
+        self.assertEqual(self.o._load_runtime_state(), {"running": True, "ts": 123.5})
+
+    def test_bin_record(self):
+        self.o._write_runtime_state(True, 42.0)
+        self.assertEqual(self.o._load_runtime_state(), {"running": True, "ts": 42.0})
+        self.o._write_runtime_state(False, 43.0)
+        self.assertEqual(self.o._load_runtime_state(), {"running": False, "ts": 43.0})
+
+    def test_truncated_or_garbage_bin_reads_not_running(self):
+        good = orch._RUNTIME_STATE.pack(True, 42.0)
+        for data in (b"", good[:5], good + b"\x00", b"\xff" * len(good), b"{\"running\": t"):
+            with open(self.bin_path, "wb") as f:
+                f.write(data)
+            self.assertFalse(self.o._load_runtime_state().get("running", False), data)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -96,6 +96,19 @@ class TestStateMachine(unittest.TestCase):
             sm.tick({})
         self.assertEqual(sm.state, SystemState.IDLE)
 
+    def test_non_str_event_is_ignored(self):
+        sm = SystemStateMachine()
+        prev = sm.state
+        self.assertEqual(sm.handle_event(None).reason, "ignored")
+        self.assertEqual(sm.handle_event(42).reason, "ignored")
+        self.assertEqual(sm.state, prev)
+
+        class Name(str):
+            pass
+
+        sm.handle_event(Name("FAULT"))
+        self.assertEqual(sm.state, SystemState.FAULT)
+
 
 if __name__ == "__main__":
     unittest.main()
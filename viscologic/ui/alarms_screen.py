@@ -178,7 +178,7 @@ class AlarmsScreen(ttk.Frame):
             self._apply_frame(payload)
 
     def _apply_frame(self, frame: Dict[str, Any]) -> None:
-        self._last_frame = dict(frame)
+        self._last_frame = frame
 
         # active alarms
         alarms = frame.get("alarms") or {}
@@ -413,7 +413,7 @@ class CalibrationWizard(ttk.Frame):
                 payload = args[-1]
 
             if isinstance(payload, dict):
-                self._last_frame = dict(payload)
+                self._last_frame = payload
         except Exception:
             pass
 
@@ -458,14 +458,14 @@ class CalibrationWizard(ttk.Frame):
                 try:
                     frame = get_frame()
                     if isinstance(frame, dict) and frame:
-                        self._last_frame = dict(frame)
+                        self._last_frame = frame
                 except Exception:
                     pass
             elif hasattr(self.bus, "latest_frame"):
                 try:
                     frame = getattr(self.bus, "latest_frame", None)
                     if isinstance(frame, dict) and frame:
-                        self._last_frame = dict(frame)
+                        self._last_frame = frame
                 except Exception:
                     pass
 
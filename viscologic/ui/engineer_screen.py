@@ -933,7 +933,7 @@ class EngineerScreen(ttk.Frame):
                 from viscologic.core.config_manager import ConfigManager
 
                 mgr = ConfigManager()
-                mgr._config_dict = config  # Set the dict directly
+                mgr.attach(config)  # Use the dict directly, no reload
                 return mgr
             except Exception:
                 # Fallback: return dict as-is (will use event bus fallback)
@@ -1329,7 +1329,7 @@ class EngineerScreen(ttk.Frame):
                 frame = args[-1]
 
             if isinstance(frame, dict):
-                self._last_frame = dict(frame)
+                self._last_frame = frame
         except Exception:
             pass
 
@@ -437,7 +437,7 @@ class OperatorScreen(ttk.Frame):
         # print(f"[DEBUG UI] Received Frame: Visc={visc:.3f} cP, Temp={temp:.1f} C, Status={status}")
         # -------------------
 
-        self._last_frame = dict(frame)
+        self._last_frame = frame
 
         cp = frame.get("viscosity_cp_display", frame.get("viscosity_cp", 0.0))
         temp = frame.get("temp_c", None)